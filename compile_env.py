@@ -0,0 +1,63 @@
+"""
+ORBIT Environment Cache
+Compiles .env.local into a plain Python module so scripts skip dotenv parsing
+"""
+
+import importlib.util
+import os
+import pprint
+import tempfile
+
+ENV_FILE = '.env.local'
+CACHE_FILE = 'env_cache.py'
+
+
+def compile_env(env_file=ENV_FILE, cache_file=CACHE_FILE):
+    """Parse the env file once and write its values out as env_cache.py"""
+    from dotenv import dotenv_values
+
+    values = {key: value or '' for key, value in dotenv_values(env_file).items()}
+    source_mtime = os.stat(env_file).st_mtime_ns
+
+    # Write beside the target and swap it in, so a concurrent reader never sees a partial file
+    cache_dir = os.path.dirname(os.path.abspath(cache_file))
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_dir, suffix='.tmp', delete=False) as f:
+        f.write(f'"""Generated from {env_file} by compile_env.py - do not edit or commit"""\n\n')
+        f.write(f"SOURCE_MTIME_NS = {source_mtime}\n\n")
+        f.write(f"ENV = {pprint.pformat(values)}\n")
+    
+    try:
+        os.replace(f.name, cache_file)
+    except OSError:
+        os.unlink(f.name)
+        raise
+
+    return values
+
+
+def load_env(env_file=ENV_FILE, cache_file=CACHE_FILE):
+    """
+    Return the env file's values, regenerating the cache when the file has
+    changed since it was compiled. Returns an empty dict if there is no env file.
+    """
+    if not os.path.exists(env_file):
+        return {}
+
+    if os.path.exists(cache_file):
+        try:
+            spec = importlib.util.spec_from_file_location('env_cache', cache_file)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except Exception:
+            # Truncated or hand-edited cache - rebuild it from the env file
+            module = None
+
+        if getattr(module, 'SOURCE_MTIME_NS', None) == os.stat(env_file).st_mtime_ns:
+            return module.ENV
+
+    return compile_env(env_file, cache_file)
+
+
+if __name__ == "__main__":
+    env = compile_env()
+    print(f"✅ Compiled {len(env)} variables from {ENV_FILE} into {CACHE_FILE}")
@@ -20,8 +20,10 @@ from opik import track, opik_context
 import structlog
 import httpx
 import json
+from tenacity import RetryCallState, retry, stop_after_attempt, wait_random_exponential
 
 from ..core.config import settings, MODEL_CONFIGS
+from ..core.llm_cache import llm_cache
 
 
 logger = structlog.get_logger(__name__)
@@ -500,17 +502,131 @@ class AgentOrchestrator:
         return health_results
 
 
+# Shared across all OpenRouterLLM instances so concurrent callers are paced together.
+# Bound to one event loop, so it is recreated when the loop changes (e.g. invoke()).
+_openrouter_semaphore: Optional[asyncio.Semaphore] = None
+_openrouter_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Free model used when a paid model's request fails
+_OPENROUTER_FALLBACK_MODEL = "meta-llama/llama-3-8b-instruct"
+
+
+def _get_openrouter_semaphore() -> asyncio.Semaphore:
+    """Get the shared OpenRouter concurrency limiter for the running event loop"""
+    global _openrouter_semaphore, _openrouter_semaphore_loop
+    
+    loop = asyncio.get_running_loop()
+    if _openrouter_semaphore is None or _openrouter_semaphore_loop is not loop:
+        _openrouter_semaphore = asyncio.Semaphore(settings.OPENROUTER_MAX_CONCURRENT)
+        _openrouter_semaphore_loop = loop
+    
+    return _openrouter_semaphore
+
+
+# HTTP/2 client reused by every OpenRouterLLM so concurrent calls share one TLS connection
+_openrouter_client: Optional[httpx.AsyncClient] = None
+_openrouter_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_openrouter_client() -> httpx.AsyncClient:
+    """Get the shared OpenRouter HTTP client, creating it for the running event loop"""
+    global _openrouter_client, _openrouter_client_loop
+    
+    loop = asyncio.get_running_loop()
+    if _openrouter_client is None or _openrouter_client.is_closed or _openrouter_client_loop is not loop:
+        # A client bound to another loop that is still running is closed on that loop
+        if (
+            _openrouter_client is not None
+            and not _openrouter_client.is_closed
+            and _openrouter_client_loop.is_running()
+        ):
+            asyncio.run_coroutine_threadsafe(_openrouter_client.aclose(), _openrouter_client_loop)
+        
+        _openrouter_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=30.0
+        )
+        _openrouter_client_loop = loop
+    
+    return _openrouter_client
+
+
+async def close_openrouter_client():
+    """Close the shared OpenRouter HTTP client (called on application shutdown)"""
+    global _openrouter_client, _openrouter_client_loop
+    
+    if _openrouter_client is not None:
+        await _openrouter_client.aclose()
+        _openrouter_client = None
+        _openrouter_client_loop = None
+
+
+def _is_transient_openrouter_error(error: BaseException) -> bool:
+    """Rate limits, server errors and connection failures are worth retrying"""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _should_retry_openrouter(retry_state: RetryCallState) -> bool:
+    """
+    Retry transient failures, except rate limits on a model that has a fallback:
+    those go straight to the free model instead of backing off first.
+    """
+    if not retry_state.outcome.failed:
+        return False
+    
+    error = retry_state.outcome.exception()
+    llm = retry_state.args[0]
+    if (
+        isinstance(error, httpx.HTTPStatusError)
+        and error.response.status_code == 429
+        and llm.model != _OPENROUTER_FALLBACK_MODEL
+    ):
+        return False
+    
+    return _is_transient_openrouter_error(error)
+
+
+class OpenRouterResponse:
+    """Response object compatible with LangChain"""
+    
+    def __init__(self, content: str, usage: dict, model: str, cached: bool = False):
+        self.content = content
+        self.response_metadata = {
+            "usage": {
+                "prompt_tokens": usage.get("prompt_tokens", 0),
+                "completion_tokens": usage.get("completion_tokens", 0),
+                "total_tokens": usage.get("total_tokens", 0)
+            },
+            "model": model,
+            "provider": "openrouter",
+            "cached": cached
+        }
+
+
 class OpenRouterLLM:
     """
     Custom LLM wrapper for OpenRouter API
     Provides cost-effective access to multiple AI models
     """
     
-    def __init__(self, model: str, temperature: float = 0.7, max_tokens: int = 2048, api_key: str = None):
+    def __init__(
+        self,
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        api_key: str = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.api_key = api_key or settings.OPEN_ROUTER_API_KEY
+        # Caller-owned client; falls back to the shared module-level client
+        self.http_client = http_client
         self.base_url = "https://openrouter.ai/api/v1/chat/completions"
         
         if not self.api_key:
@@ -550,6 +666,14 @@ class OpenRouterLLM:
             "stream": False
         }
         
+        # Serve low-temperature requests from cache when possible
+        cache_key = None
+        if llm_cache.should_cache(payload["temperature"]):
+            cache_key = llm_cache.make_key(payload)
+            cached = await llm_cache.get(cache_key)
+            if cached:
+                return OpenRouterResponse(cached["content"], cached.get("usage", {}), self.model, cached=True)
+        
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -558,49 +682,32 @@ class OpenRouterLLM:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.base_url,
-                    json=payload,
-                    headers=headers
-                )
-                response.raise_for_status()
-                
-                result = response.json()
-                
-                # Extract response content
-                content = result["choices"][0]["message"]["content"]
-                
-                # Extract usage information
-                usage = result.get("usage", {})
-                
-                # Create response object compatible with LangChain
-                class OpenRouterResponse:
-                    def __init__(self, content: str, usage: dict, model: str):
-                        self.content = content
-                        self.response_metadata = {
-                            "usage": {
-                                "prompt_tokens": usage.get("prompt_tokens", 0),
-                                "completion_tokens": usage.get("completion_tokens", 0),
-                                "total_tokens": usage.get("total_tokens", 0)
-                            },
-                            "model": model,
-                            "provider": "openrouter"
-                        }
-                
-                return OpenRouterResponse(content, usage, self.model)
-                
+            result = await self._post(payload, headers)
+            
+            # Extract response content
+            content = result["choices"][0]["message"]["content"]
+            
+            # Extract usage information
+            usage = result.get("usage", {})
+            
+            # Cache deterministic responses for repeat requests
+            if cache_key:
+                await llm_cache.set(cache_key, {"content": content, "usage": usage})
+            
+            return OpenRouterResponse(content, usage, self.model)
+            
         except httpx.HTTPStatusError as e:
             logger.error(f"OpenRouter API error: {e.response.status_code} - {e.response.text}")
             
             # Fallback to free model if paid model fails
-            if self.model != "meta-llama/llama-3-8b-instruct":
+            if self.model != _OPENROUTER_FALLBACK_MODEL:
                 logger.info("Falling back to free model")
                 fallback_llm = OpenRouterLLM(
-                    model="meta-llama/llama-3-8b-instruct",
+                    model=_OPENROUTER_FALLBACK_MODEL,
                     temperature=self.temperature,
                     max_tokens=self.max_tokens,
-                    api_key=self.api_key
+                    api_key=self.api_key,
+                    http_client=self.http_client
                 )
                 return await fallback_llm.ainvoke(messages, **kwargs)
             
@@ -610,9 +717,47 @@ class OpenRouterLLM:
             logger.error(f"OpenRouter request failed: {str(e)}")
             raise Exception(f"OpenRouter request failed: {str(e)}")
     
+    @retry(
+        retry=_should_retry_openrouter,
+        wait=wait_random_exponential(multiplier=1, max=10),
+        stop=stop_after_attempt(3),
+        reraise=True
+    )
+    async def _post(self, payload: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Send a chat completion request, retrying transient failures with jittered backoff.
+        The concurrency slot is only held while the request is in flight.
+        """
+        async with _get_openrouter_semaphore():
+            client = self.http_client or _get_openrouter_client()
+            response = await client.post(
+                self.base_url,
+                json=payload,
+                headers=headers
+            )
+            response.raise_for_status()
+            return response.json()
+    
     def invoke(self, messages: List[BaseMessage], **kwargs) -> Any:
         """
         Sync invoke method (wrapper around async)
         """
         import asyncio
-        return asyncio.run(self.ainvoke(messages, **kwargs))
\ No newline at end of file
+        if self.http_client is not None:
+            return asyncio.run(self.ainvoke(messages, **kwargs))
+        return asyncio.run(self._ainvoke_with_own_client(messages, **kwargs))
+    
+    async def _ainvoke_with_own_client(self, messages: List[BaseMessage], **kwargs) -> Any:
+        """
+        Run one call on a client scoped to it. Every asyncio.run() gets a fresh loop,
+        so the shared client would otherwise be rebuilt, and the old one leaked, per call.
+        """
+        async with httpx.AsyncClient(http2=True, timeout=30.0) as client:
+            llm = OpenRouterLLM(
+                model=self.model,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                api_key=self.api_key,
+                http_client=client
+            )
+            return await llm.ainvoke(messages, **kwargs)
\ No newline at end of file
@@ -76,6 +76,10 @@ class Settings(BaseSettings):
     DEFAULT_SUPERVISOR_MODEL: str = "claude-3-sonnet-20240229"
     MAX_TOKENS_PER_REQUEST: int = 4000
     AI_TIMEOUT_SECONDS: int = 30
+    OPENROUTER_MAX_CONCURRENT: int = 8
+    LLM_CACHE_ENABLED: bool = False  # Opt-in; the integration tests turn it on
+    LLM_CACHE_TTL_SECONDS: int = 3600
+    LLM_CACHE_MAX_TEMPERATURE: float = 0.3  # Only cache near-deterministic calls
     
     # Intervention Settings
     MIN_INTERVENTION_INTERVAL_HOURS: int = 2
@@ -0,0 +1,74 @@
+"""
+ORBIT LLM Response Cache
+Redis-backed cache for deterministic (low-temperature) LLM calls
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+import structlog
+
+from .config import settings
+from . import redis as redis_module
+from .redis import cache, RedisCache
+
+logger = structlog.get_logger(__name__)
+
+
+class LLMCache:
+    """
+    Caches LLM responses keyed by a hash of the request payload.
+    Only low-temperature requests are cached since their output is
+    close enough to deterministic to be safely replayed.
+    """
+    
+    def __init__(
+        self,
+        backend: RedisCache = cache,
+        ttl: int = settings.LLM_CACHE_TTL_SECONDS,
+        max_temperature: float = settings.LLM_CACHE_MAX_TEMPERATURE,
+        namespace: str = "llm_cache"
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.max_temperature = max_temperature
+        self.namespace = namespace
+    
+    def should_cache(self, temperature: float) -> bool:
+        """
+        Check whether a request at this temperature may be served from cache.
+        Never triggers a Redis connect: if nothing has initialized Redis yet
+        (or it failed), the call goes straight to the model.
+        """
+        return (
+            settings.LLM_CACHE_ENABLED
+            and temperature <= self.max_temperature
+            and redis_module.redis_client is not None
+        )
+    
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """Build a deterministic cache key from the model, messages and sampling params"""
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response, or None on miss"""
+        cached = await self.backend.get(key, namespace=self.namespace)
+        if isinstance(cached, dict):
+            logger.debug("LLM cache hit", key=key)
+            return cached
+        return None
+    
+    async def set(self, key: str, response: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Store a response under the given key"""
+        return await self.backend.set(
+            key,
+            response,
+            expire=ttl or self.ttl,
+            namespace=self.namespace
+        )
+
+
+# Global LLM cache instance
+llm_cache = LLMCache()
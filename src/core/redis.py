@@ -3,9 +3,11 @@ ORBIT Redis Configuration
 Redis client setup for caching and session management
 """
 
+import asyncio
 import redis.asyncio as redis
-import json
-from typing import Any, Optional, Dict
+import orjson
+from contextlib import asynccontextmanager
+from typing import Any, Optional, Dict, List, AsyncIterator
 from datetime import datetime, timedelta
 import structlog
 
@@ -13,45 +15,82 @@ from .config import settings
 
 logger = structlog.get_logger(__name__)
 
-# Global Redis client
+# Global Redis client and the connection pool backing it
 redis_client: Optional[redis.Redis] = None
+redis_pool: Optional[redis.ConnectionPool] = None
+
+# Upper bound on open sockets to Redis
+REDIS_MAX_CONNECTIONS = 100
+
+# Serializes first-time initialization; recreated if the event loop changes
+_init_lock: Optional[asyncio.Lock] = None
+_init_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_init_lock() -> asyncio.Lock:
+    """Return the init lock bound to the running event loop"""
+    global _init_lock, _init_lock_loop
+    
+    loop = asyncio.get_running_loop()
+    if _init_lock is None or _init_lock_loop is not loop:
+        _init_lock = asyncio.Lock()
+        _init_lock_loop = loop
+    return _init_lock
 
 
 async def init_redis():
-    """Initialize Redis connection"""
-    global redis_client
+    """Initialize Redis connection pool and client (no-op if already initialized)"""
+    global redis_client, redis_pool
     
-    try:
-        # Parse Redis URL from environment
-        redis_url = settings.REDIS_URL
-        
-        # Parse URL components for Upstash Redis
-        from urllib.parse import urlparse
-        parsed = urlparse(redis_url)
-        
-        # Create Redis client with direct connection for Upstash
-        redis_client = redis.Redis(
-            host=parsed.hostname,
-            port=parsed.port,
-            username=parsed.username,
-            password=parsed.password,
-            ssl=True,
-            ssl_check_hostname=False,
-            decode_responses=True,
-            socket_connect_timeout=30,
-            socket_timeout=30,
-            retry_on_timeout=True,
-            health_check_interval=30
-        )
-        
-        # Test connection
-        await redis_client.ping()
-        
-        logger.info("Redis connection established", host=parsed.hostname)
+    if redis_client is not None:
+        return
+    
+    async with _get_init_lock():
+        # Another caller may have finished initializing while we waited
+        if redis_client is not None:
+            return
         
-    except Exception as e:
-        logger.error("Failed to connect to Redis", error=str(e))
-        raise
+        pool = None
+        try:
+            # Parse Redis URL from environment
+            redis_url = settings.REDIS_URL
+            
+            # Parse URL components for Upstash Redis
+            from urllib.parse import urlparse
+            parsed = urlparse(redis_url)
+            
+            # Shared TLS connection pool for Upstash so connections are reused.
+            # A plain ConnectionPool: BlockingConnectionPool in redis 5.0.1 deadlocks
+            # on a failed connect and hides the real error.
+            pool = redis.ConnectionPool(
+                connection_class=redis.SSLConnection,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                host=parsed.hostname,
+                port=parsed.port,
+                username=parsed.username,
+                password=parsed.password,
+                ssl_check_hostname=False,
+                decode_responses=True,
+                socket_connect_timeout=30,
+                socket_timeout=30,
+                retry_on_timeout=True,
+                health_check_interval=30
+            )
+            
+            client = redis.Redis(connection_pool=pool)
+            
+            # Test connection
+            await client.ping()
+            
+            redis_pool = pool
+            redis_client = client
+            logger.info("Redis connection established", host=parsed.hostname)
+            
+        except Exception as e:
+            logger.error("Failed to connect to Redis", error=str(e))
+            if pool is not None:
+                await pool.disconnect()
+            raise
 
 
 async def get_redis() -> redis.Redis:
@@ -64,11 +103,92 @@ async def get_redis() -> redis.Redis:
     return redis_client
 
 
+def _serialize(value: Any) -> Any:
+    """
+    Serialize a value for storage in Redis (datetimes are encoded natively).
+    Bytes are taken as already encoded and stored unchanged.
+    """
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return str(value)
+
+
+def _deserialize(value: Any) -> Any:
+    """Deserialize a value read from Redis, falling back to the raw value"""
+    if value is None:
+        return None
+    try:
+        return orjson.loads(value)
+    except (orjson.JSONDecodeError, TypeError):
+        return value
+
+
+# Sets each KEYS[i] to ARGV[i] with the TTL passed as the last ARGV, in one server-side call
+_SET_MANY_SCRIPT = """
+local ttl = tonumber(ARGV[#ARGV])
+for i = 1, #KEYS do
+    redis.call('SET', KEYS[i], ARGV[i], 'EX', ttl)
+end
+return #KEYS
+"""
+
+
+class CachePipeline:
+    """
+    Batches RedisCache operations so they ship in a single round-trip.
+    Commands are queued until execute() is awaited.
+    """
+    
+    def __init__(self, pipe):
+        self._pipe = pipe
+        self._decoders = []
+    
+    def set(
+        self, 
+        key: str, 
+        value: Any, 
+        expire: Optional[int] = None,
+        namespace: str = "orbit"
+    ) -> "CachePipeline":
+        """Queue a cache write"""
+        full_key = f"{namespace}:{key}"
+        serialized_value = _serialize(value)
+        
+        if expire:
+            self._pipe.setex(full_key, expire, serialized_value)
+        else:
+            self._pipe.set(full_key, serialized_value)
+        
+        self._decoders.append(bool)
+        return self
+    
+    def get(self, key: str, namespace: str = "orbit") -> "CachePipeline":
+        """Queue a cache read"""
+        self._pipe.get(f"{namespace}:{key}")
+        self._decoders.append(_deserialize)
+        return self
+    
+    def delete(self, key: str, namespace: str = "orbit") -> "CachePipeline":
+        """Queue a key deletion"""
+        self._pipe.delete(f"{namespace}:{key}")
+        self._decoders.append(lambda result: result > 0)
+        return self
+    
+    async def execute(self) -> List[Any]:
+        """Send all queued commands and return their decoded results in order"""
+        results = await self._pipe.execute()
+        decoders, self._decoders = self._decoders, []
+        return [decode(result) for decode, result in zip(decoders, results)]
+
+
 class RedisCache:
     """Redis-based caching utility for ORBIT"""
     
     def __init__(self):
         self.client = None
+        self._set_many_script = None
     
     async def _get_client(self):
         """Get Redis client"""
@@ -99,10 +219,7 @@ class RedisCache:
             full_key = f"{namespace}:{key}"
             
             # Serialize value
-            if isinstance(value, (dict, list)):
-                serialized_value = json.dumps(value)
-            else:
-                serialized_value = str(value)
+            serialized_value = _serialize(value)
             
             # Set with expiration
             if expire:
@@ -143,15 +260,60 @@ class RedisCache:
                 return default
             
             # Try to deserialize JSON
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                return value
+            return _deserialize(value)
                 
         except Exception as e:
             logger.error("Redis get failed", key=key, error=str(e))
             return default
     
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        expire: int,
+        namespace: str = "orbit"
+    ) -> bool:
+        """
+        Set several values with the same expiration in a single command
+        
+        Args:
+            items: Mapping of cache key to value (values are JSON serialized)
+            expire: Expiration time in seconds
+            namespace: Key namespace
+        """
+        if not items:
+            return True
+        
+        try:
+            client = await self._get_client()
+            
+            # Registered once; later calls reuse the script SHA via EVALSHA
+            if self._set_many_script is None:
+                self._set_many_script = client.register_script(_SET_MANY_SCRIPT)
+            
+            await self._set_many_script(
+                keys=[f"{namespace}:{key}" for key in items],
+                args=[*map(_serialize, items.values()), expire]
+            )
+            return True
+            
+        except Exception as e:
+            logger.error("Redis bulk set failed", count=len(items), error=str(e))
+            return False
+    
+    async def get_many(self, keys: List[str], namespace: str = "orbit") -> List[Any]:
+        """Get several values with a single MGET, None for missing keys"""
+        if not keys:
+            return []
+        
+        try:
+            client = await self._get_client()
+            values = await client.mget([f"{namespace}:{key}" for key in keys])
+            return [_deserialize(value) for value in values]
+            
+        except Exception as e:
+            logger.error("Redis bulk get failed", count=len(keys), error=str(e))
+            return [None] * len(keys)
+    
     async def delete(self, key: str, namespace: str = "orbit") -> bool:
         """Delete a key from Redis cache"""
         try:
@@ -165,6 +327,36 @@ class RedisCache:
             logger.error("Redis delete failed", key=key, error=str(e))
             return False
     
+    async def delete_many(self, keys: List[str], namespace: str = "orbit") -> int:
+        """
+        Delete several keys in a single command, returning how many were removed.
+        Uses UNLINK so the server reclaims the memory in the background.
+        """
+        if not keys:
+            return 0
+        
+        try:
+            client = await self._get_client()
+            return await client.unlink(*[f"{namespace}:{key}" for key in keys])
+            
+        except Exception as e:
+            logger.error("Redis bulk delete failed", count=len(keys), error=str(e))
+            return 0
+    
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = False) -> AsyncIterator[CachePipeline]:
+        """
+        Batch several cache operations into one round-trip
+        
+        Usage:
+            async with cache.pipeline() as pipe:
+                pipe.set("a", {...}, expire=300).get("b")
+                results = await pipe.execute()
+        """
+        client = await self._get_client()
+        async with client.pipeline(transaction=transaction) as pipe:
+            yield CachePipeline(pipe)
+    
     async def exists(self, key: str, namespace: str = "orbit") -> bool:
         """Check if a key exists in Redis cache"""
         try:
@@ -216,12 +408,7 @@ class RedisCache:
             full_key = f"{namespace}:{key}"
             
             # Serialize values in mapping
-            serialized_mapping = {}
-            for k, v in mapping.items():
-                if isinstance(v, (dict, list)):
-                    serialized_mapping[k] = json.dumps(v)
-                else:
-                    serialized_mapping[k] = str(v)
+            serialized_mapping = {k: _serialize(v) for k, v in mapping.items()}
             
             # Set hash
             await client.hset(full_key, mapping=serialized_mapping)
@@ -250,26 +437,13 @@ class RedisCache:
             if field:
                 # Get specific field
                 value = await client.hget(full_key, field)
-                if value is None:
-                    return None
-                
-                try:
-                    return json.loads(value)
-                except (json.JSONDecodeError, TypeError):
-                    return value
+                return _deserialize(value)
             else:
                 # Get entire hash
                 hash_data = await client.hgetall(full_key)
                 
                 # Deserialize values
-                result = {}
-                for k, v in hash_data.items():
-                    try:
-                        result[k] = json.loads(v)
-                    except (json.JSONDecodeError, TypeError):
-                        result[k] = v
-                
-                return result
+                return {k: _deserialize(v) for k, v in hash_data.items()}
                 
         except Exception as e:
             logger.error("Redis hash get failed", key=key, field=field, error=str(e))
@@ -303,6 +477,10 @@ class SessionManager:
         self.session_prefix = "session"
         self.default_expire = 24 * 60 * 60  # 24 hours
     
+    def key(self, session_id: str) -> str:
+        """Cache key (without namespace) under which a session is stored"""
+        return f"{self.session_prefix}:{session_id}"
+    
     async def create_session(
         self, 
         user_id: str, 
@@ -313,7 +491,7 @@ class SessionManager:
         import uuid
         
         session_id = str(uuid.uuid4())
-        session_key = f"{self.session_prefix}:{session_id}"
+        session_key = self.key(session_id)
         
         # Add metadata
         session_data.update({
@@ -333,7 +511,7 @@ class SessionManager:
     
     async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get session data"""
-        session_key = f"{self.session_prefix}:{session_id}"
+        session_key = self.key(session_id)
         session_data = await self.cache.get(session_key)
         
         if session_data:
@@ -349,7 +527,7 @@ class SessionManager:
         updates: Dict[str, Any]
     ) -> bool:
         """Update session data"""
-        session_key = f"{self.session_prefix}:{session_id}"
+        session_key = self.key(session_id)
         session_data = await self.cache.get(session_key)
         
         if session_data:
@@ -366,7 +544,7 @@ class SessionManager:
     
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session"""
-        session_key = f"{self.session_prefix}:{session_id}"
+        session_key = self.key(session_id)
         return await self.cache.delete(session_key)
     
     async def cleanup_expired_sessions(self):
@@ -19,6 +19,7 @@ from src.database.database import init_db
 from src.core.redis import init_redis, health_check_redis
 from src.api.main import app as api_app
 from src.api.auth import router as auth_router
+from src.agents.base_agent import close_openrouter_client
 
 # Configure logging
 logging.basicConfig(
@@ -87,6 +88,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 Shutting down ORBIT platform...")
+    await close_openrouter_client()
 
 # Create FastAPI application
 app = FastAPI(
@@ -116,7 +118,7 @@ app.add_middleware(
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions and send to Sentry"""
-    logger.error(f"Unexpected error: {exc}", exc_info=True)
+    logger.error("Unexpected error: %s", exc, exc_info=True)
     
     # Capture exception in Sentry
     if settings.SENTRY_DSN:
@@ -162,7 +164,7 @@ async def health_check():
         }
         
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         
         # Capture health check failures in Sentry
         if settings.SENTRY_DSN:
@@ -0,0 +1,12 @@
+"""
+Shared console output helper for the test scripts
+Writes a whole section in one call instead of one print per line
+"""
+
+import sys
+
+
+def emit(*lines):
+    """Write the given lines as one block and flush so it shows up immediately"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
@@ -0,0 +1,70 @@
+"""
+Shared SMTP helpers for the email test scripts
+Opens one authenticated session that any number of messages can be sent over
+"""
+
+import asyncio
+import random
+from contextlib import asynccontextmanager
+
+import aiosmtplib
+
+# SMTP reply codes that signal a temporary server-side condition
+TRANSIENT_SMTP_CODES = {421, 450, 451}
+
+
+def _is_transient(error):
+    """Check whether a connect/login failure is worth retrying"""
+    # Timeouts (including SMTPConnectTimeoutError) and mid-session drops
+    if isinstance(error, (aiosmtplib.SMTPServerDisconnected, TimeoutError, ConnectionResetError)):
+        return True
+    # Greeting or login replies carry a code; only temporary ones are retried
+    if isinstance(error, aiosmtplib.SMTPResponseException):
+        return error.code in TRANSIENT_SMTP_CODES
+    # connect() wraps socket errors in SMTPConnectError - retry resets and timeouts only,
+    # not refused connections, DNS failures or certificate errors
+    if isinstance(error, aiosmtplib.SMTPConnectError):
+        return isinstance(error.__cause__, (ConnectionResetError, TimeoutError))
+    return False
+
+
+async def _connect_with_retry(factory, user, password, attempts=3, base=1.0):
+    """Connect and log in, backing off on transient failures"""
+    for attempt in range(attempts):
+        client = factory()
+        try:
+            await client.connect()
+            await client.login(user, password)
+            return client
+            
+        except Exception as e:
+            # Drop the half-open socket so the next attempt starts clean
+            client.close()
+            if attempt == attempts - 1 or not _is_transient(e):
+                raise
+            delay = base * 3 ** attempt
+            await asyncio.sleep(delay + random.uniform(0, delay))
+
+
+@asynccontextmanager
+async def smtp_session(host, port, user, password, use_ssl=False, timeout=10):
+    """Yield an authenticated SMTP (STARTTLS) or implicit-TLS connection, closed on exit"""
+    # asyncio tries every address the hostname resolves to (IPv4 and IPv6) and the
+    # certificate is checked against it; STARTTLS is negotiated inside connect()
+    factory = lambda: aiosmtplib.SMTP(
+        hostname=host,
+        port=port,
+        use_tls=use_ssl,
+        start_tls=not use_ssl,
+        timeout=timeout
+    )
+    
+    client = await _connect_with_retry(factory, user, password)
+    
+    try:
+        yield client
+    finally:
+        try:
+            await client.quit()
+        except aiosmtplib.SMTPServerDisconnected:
+            client.close()
@@ -3,68 +3,91 @@ Generate Secure Secret Keys for ORBIT
 Creates cryptographically secure random keys for production use
 """
 
+import base64
 import secrets
 import sys
+from _output import emit
+
+# Separator lines, built once
+_EQ = "=" * 70
+_DASH = "-" * 70
 
 def generate_secret_key(length=32):
     """Generate a URL-safe secret key"""
     return secrets.token_urlsafe(length)
 
+def generate_secret_keys(count, length=32):
+    """Generate several URL-safe secret keys from a single entropy read"""
+    raw = secrets.token_bytes(count * length)
+    return [
+        base64.urlsafe_b64encode(raw[i:i + length]).rstrip(b'=').decode('ascii')
+        for i in range(0, count * length, length)
+    ]
+
 def generate_hex_key(length=32):
     """Generate a hexadecimal secret key"""
     return secrets.token_hex(length)
 
 def main():
-    print("=" * 70)
-    print("🔐 ORBIT SECRET KEY GENERATOR")
-    print("=" * 70)
-    print()
-    print("Generating cryptographically secure secret keys...")
-    print()
+    emit(
+        _EQ,
+        "🔐 ORBIT SECRET KEY GENERATOR",
+        _EQ,
+        "",
+        "Generating cryptographically secure secret keys...",
+        "",
+    )
     
     # Generate keys
-    secret_key = generate_secret_key(32)
-    jwt_secret = generate_secret_key(32)
-    encryption_key = generate_secret_key(32)
+    (
+        secret_key, jwt_secret, encryption_key,
+        n8n_encryption_key, n8n_jwt_secret, backup_encryption_key, grafana_secret_key
+    ) = generate_secret_keys(7, 32)
     
     # Display keys
-    print("📋 COPY THESE TO YOUR .env FILE:")
-    print("-" * 70)
-    print()
-    print(f"SECRET_KEY={secret_key}")
-    print(f"JWT_SECRET_KEY={jwt_secret}")
-    print(f"ENCRYPTION_KEY={encryption_key}")
-    print()
-    print("-" * 70)
-    print()
+    emit(
+        "📋 COPY THESE TO YOUR .env FILE:",
+        _DASH,
+        "",
+        f"SECRET_KEY={secret_key}",
+        f"JWT_SECRET_KEY={jwt_secret}",
+        f"ENCRYPTION_KEY={encryption_key}",
+        "",
+        _DASH,
+        "",
+    )
     
     # Additional keys for other services
-    print("🔧 ADDITIONAL KEYS (Optional):")
-    print("-" * 70)
-    print()
-    print(f"N8N_ENCRYPTION_KEY={generate_secret_key(32)}")
-    print(f"N8N_JWT_SECRET={generate_secret_key(32)}")
-    print(f"BACKUP_ENCRYPTION_KEY={generate_secret_key(32)}")
-    print(f"GRAFANA_SECRET_KEY={generate_secret_key(32)}")
-    print()
-    print("-" * 70)
-    print()
+    emit(
+        "🔧 ADDITIONAL KEYS (Optional):",
+        _DASH,
+        "",
+        f"N8N_ENCRYPTION_KEY={n8n_encryption_key}",
+        f"N8N_JWT_SECRET={n8n_jwt_secret}",
+        f"BACKUP_ENCRYPTION_KEY={backup_encryption_key}",
+        f"GRAFANA_SECRET_KEY={grafana_secret_key}",
+        "",
+        _DASH,
+        "",
+    )
     
     # Security notes
-    print("🔒 SECURITY NOTES:")
-    print("-" * 70)
-    print("✅ All keys are cryptographically secure (256-bit)")
-    print("✅ Keys are URL-safe (can be used in URLs/headers)")
-    print("✅ Keys are unique and randomly generated")
-    print()
-    print("⚠️  IMPORTANT:")
-    print("   • Never commit these keys to version control")
-    print("   • Use different keys for dev/staging/production")
-    print("   • Rotate keys periodically (every 90 days)")
-    print("   • Store production keys in secure vault (AWS Secrets Manager, etc.)")
-    print()
-    print("=" * 70)
-    print()
+    emit(
+        "🔒 SECURITY NOTES:",
+        _DASH,
+        "✅ All keys are cryptographically secure (256-bit)",
+        "✅ Keys are URL-safe (can be used in URLs/headers)",
+        "✅ Keys are unique and randomly generated",
+        "",
+        "⚠️  IMPORTANT:",
+        "   • Never commit these keys to version control",
+        "   • Use different keys for dev/staging/production",
+        "   • Rotate keys periodically (every 90 days)",
+        "   • Store production keys in secure vault (AWS Secrets Manager, etc.)",
+        "",
+        _EQ,
+        "",
+    )
     
     # Save to file option
     if len(sys.argv) > 1 and sys.argv[1] == "--save":
@@ -74,14 +97,16 @@ def main():
             f.write(f"SECRET_KEY={secret_key}\n")
             f.write(f"JWT_SECRET_KEY={jwt_secret}\n")
             f.write(f"ENCRYPTION_KEY={encryption_key}\n")
-            f.write(f"N8N_ENCRYPTION_KEY={generate_secret_key(32)}\n")
-            f.write(f"N8N_JWT_SECRET={generate_secret_key(32)}\n")
-            f.write(f"BACKUP_ENCRYPTION_KEY={generate_secret_key(32)}\n")
-            f.write(f"GRAFANA_SECRET_KEY={generate_secret_key(32)}\n")
+            f.write(f"N8N_ENCRYPTION_KEY={n8n_encryption_key}\n")
+            f.write(f"N8N_JWT_SECRET={n8n_jwt_secret}\n")
+            f.write(f"BACKUP_ENCRYPTION_KEY={backup_encryption_key}\n")
+            f.write(f"GRAFANA_SECRET_KEY={grafana_secret_key}\n")
         
-        print(f"💾 Keys saved to: {filename}")
-        print(f"⚠️  Remember to add {filename} to .gitignore!")
-        print()
+        emit(
+            f"💾 Keys saved to: {filename}",
+            f"⚠️  Remember to add {filename} to .gitignore!",
+            "",
+        )
 
 if __name__ == "__main__":
     main()
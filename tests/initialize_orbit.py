@@ -6,15 +6,21 @@ Initializes database, creates tables, and sets up the platform
 import asyncio
 from dotenv import load_dotenv
 import sys
+from _output import emit
 
 # Load environment
 load_dotenv('.env.local')
 
+# Separator lines, built once
+_EQ = "=" * 70
+
 def initialize_database():
     """Initialize SQLite database and create tables"""
-    print("=" * 70)
-    print("🗄️  INITIALIZING ORBIT DATABASE")
-    print("=" * 70)
+    emit(
+        _EQ,
+        "🗄️  INITIALIZING ORBIT DATABASE",
+        _EQ,
+    )
     
     try:
         from src.database.database import init_db, engine
@@ -28,8 +34,10 @@ def initialize_database():
         inspector = inspect(engine)
         tables = inspector.get_table_names()
         
-        print(f"\n✅ Database initialized successfully!")
-        print(f"📊 Created {len(tables)} tables:")
+        emit(
+            f"\n✅ Database initialized successfully!",
+            f"📊 Created {len(tables)} tables:",
+        )
         for table in tables:
             print(f"   • {table}")
         
@@ -44,9 +52,11 @@ def initialize_database():
 
 async def test_redis():
     """Test Redis connection"""
-    print("\n" + "=" * 70)
-    print("⚡ TESTING REDIS CONNECTION")
-    print("=" * 70)
+    emit(
+        "\n" + _EQ,
+        "⚡ TESTING REDIS CONNECTION",
+        _EQ,
+    )
     
     try:
         from src.core.redis import init_redis, cache
@@ -74,19 +84,23 @@ async def test_redis():
 
 def test_ai_models():
     """Test AI model configuration"""
-    print("\n" + "=" * 70)
-    print("🤖 TESTING AI MODELS")
-    print("=" * 70)
+    emit(
+        "\n" + _EQ,
+        "🤖 TESTING AI MODELS",
+        _EQ,
+    )
     
     try:
         from src.core.config import MODEL_CONFIGS
         
         print("\n📋 Configured Models:")
         for agent_type, config in MODEL_CONFIGS.items():
-            print(f"\n{agent_type.upper()} Agent:")
-            print(f"   Model: {config['model']}")
-            print(f"   Provider: {config['provider']}")
-            print(f"   Max Tokens: {config['max_tokens']}")
+            emit(
+                f"\n{agent_type.upper()} Agent:",
+                f"   Model: {config['model']}",
+                f"   Provider: {config['provider']}",
+                f"   Max Tokens: {config['max_tokens']}",
+            )
         
         print("\n✅ AI models configured!")
         return True
@@ -98,18 +112,22 @@ def test_ai_models():
 
 def test_email():
     """Test email configuration"""
-    print("\n" + "=" * 70)
-    print("📧 TESTING EMAIL CONFIGURATION")
-    print("=" * 70)
+    emit(
+        "\n" + _EQ,
+        "📧 TESTING EMAIL CONFIGURATION",
+        _EQ,
+    )
     
     try:
         from src.core.config import settings
         
         if settings.SMTP_USER and settings.SMTP_PASSWORD:
-            print(f"\n✅ Email configured:")
-            print(f"   SMTP Host: {settings.SMTP_HOST}")
-            print(f"   SMTP Port: {settings.SMTP_PORT}")
-            print(f"   From Email: {settings.FROM_EMAIL}")
+            emit(
+                f"\n✅ Email configured:",
+                f"   SMTP Host: {settings.SMTP_HOST}",
+                f"   SMTP Port: {settings.SMTP_PORT}",
+                f"   From Email: {settings.FROM_EMAIL}",
+            )
             return True
         else:
             print("\n⚠️  Email not fully configured")
@@ -122,11 +140,13 @@ def test_email():
 
 async def main():
     """Main initialization function"""
-    print("\n")
-    print("🚀" * 35)
-    print("🎯 ORBIT PLATFORM INITIALIZATION")
-    print("🚀" * 35)
-    print("\n")
+    emit(
+        "\n",
+        "🚀" * 35,
+        "🎯 ORBIT PLATFORM INITIALIZATION",
+        "🚀" * 35,
+        "\n",
+    )
     
     results = {}
     
@@ -143,9 +163,11 @@ async def main():
     results['email'] = test_email()
     
     # Summary
-    print("\n" + "=" * 70)
-    print("📊 INITIALIZATION SUMMARY")
-    print("=" * 70)
+    emit(
+        "\n" + _EQ,
+        "📊 INITIALIZATION SUMMARY",
+        _EQ,
+    )
     
     total = len(results)
     passed = sum(1 for v in results.values() if v)
@@ -154,39 +176,47 @@ async def main():
         status_icon = "✅" if status else "❌"
         print(f"{status_icon} {component.upper().replace('_', ' ')}: {'PASSED' if status else 'FAILED'}")
     
-    print("\n" + "=" * 70)
-    print(f"🎯 RESULT: {passed}/{total} components initialized")
-    print("=" * 70)
+    emit(
+        "\n" + _EQ,
+        f"🎯 RESULT: {passed}/{total} components initialized",
+        _EQ,
+    )
     
     if passed == total:
-        print("\n🎉 ALL SYSTEMS READY!")
-        print("\n✅ Your ORBIT platform is fully initialized and ready to use!")
-        print("\n🚀 Next Steps:")
-        print("   1. Start backend:  python -m uvicorn src.main:app --reload")
-        print("   2. Start frontend: cd frontend && npm start")
-        print("   3. Open browser:   http://localhost:3000")
-        print("   4. Register account and start using ORBIT!")
-        
-        print("\n💡 Test Commands:")
-        print("   • Test email:      python test_email.py")
-        print("   • Test monitoring: python test_monitoring.py")
-        print("   • Verify setup:    python verify_setup.py")
+        emit(
+            "\n🎉 ALL SYSTEMS READY!",
+            "\n✅ Your ORBIT platform is fully initialized and ready to use!",
+            "\n🚀 Next Steps:",
+            "   1. Start backend:  python -m uvicorn src.main:app --reload",
+            "   2. Start frontend: cd frontend && npm start",
+            "   3. Open browser:   http://localhost:3000",
+            "   4. Register account and start using ORBIT!",
+            "\n💡 Test Commands:",
+            "   • Test email:      python test_email.py",
+            "   • Test monitoring: python test_monitoring.py",
+            "   • Verify setup:    python verify_setup.py",
+        )
         
     elif passed >= total - 1:
-        print("\n✅ CORE SYSTEMS READY!")
-        print("\n⚠️  Some optional features need configuration")
-        print("   But you can start using ORBIT now!")
-        
-        print("\n🚀 Start the platform:")
-        print("   Backend:  python -m uvicorn src.main:app --reload")
-        print("   Frontend: cd frontend && npm start")
+        emit(
+            "\n✅ CORE SYSTEMS READY!",
+            "\n⚠️  Some optional features need configuration",
+            "   But you can start using ORBIT now!",
+            "\n🚀 Start the platform:",
+            "   Backend:  python -m uvicorn src.main:app --reload",
+            "   Frontend: cd frontend && npm start",
+        )
         
     else:
-        print("\n⚠️  SOME SYSTEMS NEED ATTENTION")
-        print("\nPlease fix the failed components before starting.")
-    
-    print("\n" + "=" * 70)
-    print("\n")
+        emit(
+            "\n⚠️  SOME SYSTEMS NEED ATTENTION",
+            "\nPlease fix the failed components before starting.",
+        )
+    
+    emit(
+        "\n" + _EQ,
+        "\n",
+    )
     
     return passed >= total - 1
 
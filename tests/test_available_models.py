@@ -5,77 +5,143 @@ Test script to check available models on OpenRouter
 
 import asyncio
 import os
+import re
+import types
 import httpx
+import ijson
+import orjson
 from dotenv import load_dotenv
+from _output import emit
 
 # Load environment variables
 load_dotenv('.env.local')
 
-async def check_openrouter_models():
+# Separator lines, built once
+_DASH = "-" * 60
+
+# Snapshot the variables these tests read so they stay fixed for the whole run
+REQUIRED_KEYS = (
+    'OPEN_ROUTER_API_KEY',
+)
+_ENV = types.MappingProxyType({k: os.environ[k] for k in REQUIRED_KEYS if k in os.environ})
+
+# Model families relevant to ORBIT
+_RELEVANT = re.compile(r'claude|gpt|llama|gemini', re.IGNORECASE)
+
+async def check_openrouter_models(client: httpx.AsyncClient):
     """Check available models on OpenRouter"""
     
-    api_key = os.getenv('OPEN_ROUTER_API_KEY')
+    api_key = _ENV.get('OPEN_ROUTER_API_KEY')
     
     if not api_key:
         print("❌ No OpenRouter API key found")
         return
     
-    print("🔍 Checking available models on OpenRouter...")
-    print(f"API Key: {api_key[:20]}...")
-    print("-" * 60)
+    emit(
+        "🔍 Checking available models on OpenRouter...",
+        f"API Key: {api_key[:20]}...",
+        _DASH,
+    )
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://openrouter.ai/api/v1/models",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                }
-            )
+        async with client.stream(
+            "GET",
+            "https://openrouter.ai/api/v1/models",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            }
+        ) as response:
             
             if response.status_code == 200:
-                models = response.json()
+                # Stream-parse the catalog so only the models we display are kept
+                total_models = 0
+                relevant_count = 0
+                relevant_models = []
                 
-                print(f"✅ Found {len(models.get('data', []))} models")
+                events = ijson.sendable_list()
+                parser = ijson.items_coro(events, 'data.item')
                 
-                # Filter for relevant models
-                relevant_models = []
-                for model in models.get('data', []):
-                    model_id = model.get('id', '')
-                    if any(keyword in model_id.lower() for keyword in ['claude', 'gpt', 'llama', 'gemini']):
-                        relevant_models.append({
-                            'id': model_id,
-                            'name': model.get('name', ''),
-                            'pricing': model.get('pricing', {}),
-                            'context_length': model.get('context_length', 0)
-                        })
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+                    for model in events:
+                        total_models += 1
+                        
+                        # Filter for relevant models
+                        model_id = model.get('id', '')
+                        if _RELEVANT.search(model_id):
+                            relevant_count += 1
+                            if len(relevant_models) < 20:  # Show first 20
+                                relevant_models.append({
+                                    'id': model_id,
+                                    'name': model.get('name', ''),
+                                    'pricing': model.get('pricing', {}),
+                                    'context_length': model.get('context_length', 0)
+                                })
+                    del events[:]
+                parser.close()
+                
+                print(f"✅ Found {total_models} models")
                 
-                print(f"\n📋 Relevant models for ORBIT ({len(relevant_models)} found):")
-                print("-" * 60)
+                emit(
+                    f"\n📋 Relevant models for ORBIT ({relevant_count} found):",
+                    _DASH,
+                )
                 
-                for model in relevant_models[:20]:  # Show first 20
+                for model in relevant_models:
                     pricing = model['pricing']
                     prompt_cost = pricing.get('prompt', 'N/A')
                     completion_cost = pricing.get('completion', 'N/A')
                     
-                    print(f"🤖 {model['id']}")
-                    print(f"   Name: {model['name']}")
-                    print(f"   Context: {model['context_length']:,} tokens")
-                    print(f"   Cost: ${prompt_cost}/1M prompt, ${completion_cost}/1M completion")
-                    print()
+                    emit(
+                        f"🤖 {model['id']}",
+                        f"   Name: {model['name']}",
+                        f"   Context: {model['context_length']:,} tokens",
+                        f"   Cost: ${prompt_cost}/1M prompt, ${completion_cost}/1M completion",
+                        "",
+                    )
                 
             else:
-                print(f"❌ Failed to fetch models: {response.status_code}")
-                print(f"Response: {response.text}")
+                await response.aread()
+                emit(
+                    f"❌ Failed to fetch models: {response.status_code}",
+                    f"Response: {response.text}",
+                )
                 
     except Exception as e:
         print(f"❌ Error checking models: {str(e)}")
 
-async def test_simple_models():
+async def probe_model(client: httpx.AsyncClient, model: str, headers: dict) -> str:
+    """Send a one-word prompt to a single model and describe the outcome"""
+    try:
+        payload = {
+            "model": model,
+            "messages": [
+                {"role": "user", "content": "Say 'Hello' in one word."}
+            ],
+            "max_tokens": 10
+        }
+        
+        response = await client.post(
+            "https://openrouter.ai/api/v1/chat/completions",
+            json=payload,
+            headers=headers
+        )
+        
+        if response.status_code == 200:
+            result = orjson.loads(response.content)
+            content = result["choices"][0]["message"]["content"]
+            return f"✅ {model}: {content.strip()}"
+        else:
+            return f"❌ {model}: {response.status_code} - {response.text[:100]}"
+            
+    except Exception as e:
+        return f"❌ {model}: {str(e)}"
+
+async def test_simple_models(client: httpx.AsyncClient):
     """Test some basic models that should work"""
     
-    api_key = os.getenv('OPEN_ROUTER_API_KEY')
+    api_key = _ENV.get('OPEN_ROUTER_API_KEY')
     
     # Try some basic models
     test_models = [
@@ -85,44 +151,30 @@ async def test_simple_models():
         "google/gemini-pro"
     ]
     
-    print("\n🧪 Testing basic models...")
-    print("-" * 60)
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    }
     
-    for model in test_models:
-        try:
-            payload = {
-                "model": model,
-                "messages": [
-                    {"role": "user", "content": "Say 'Hello' in one word."}
-                ],
-                "max_tokens": 10
-            }
-            
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    json=payload,
-                    headers=headers
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    content = result["choices"][0]["message"]["content"]
-                    print(f"✅ {model}: {content.strip()}")
-                else:
-                    print(f"❌ {model}: {response.status_code} - {response.text[:100]}")
-                    
-        except Exception as e:
-            print(f"❌ {model}: {str(e)}")
+    emit(
+        "\n🧪 Testing basic models...",
+        _DASH,
+    )
+    
+    # Probe all models concurrently over the shared connection
+    results = await asyncio.gather(*[probe_model(client, model, headers) for model in test_models])
+    for line in results:
+        print(line)
 
 async def main():
-    await check_openrouter_models()
-    await test_simple_models()
+    # One client for every request so the TLS connection to OpenRouter is reused
+    async with httpx.AsyncClient(
+        timeout=10.0,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20)
+    ) as client:
+        await check_openrouter_models(client)
+        await test_simple_models(client)
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
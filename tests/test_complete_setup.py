@@ -6,6 +6,8 @@ Tests all configured services and components
 import asyncio
 import os
 import sys
+import types
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path
@@ -13,10 +15,48 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from dotenv import load_dotenv
+from _output import emit
 
 # Load environment variables
 load_dotenv('.env.local')
 
+# Separator lines, built once
+_EQ = "=" * 60
+
+# Snapshot the variables these tests read so they stay fixed for the whole run
+REQUIRED_KEYS = (
+    'GOOGLE_API_KEY',
+    'OPEN_ROUTER_API_KEY',
+    'REDIS_URL',
+    'OPIK_API_KEY',
+    'OPIK_PROJECT_NAME',
+    'OPIK_WORKSPACE',
+    'DATABASE_URL',
+    'SECRET_KEY',
+    'JWT_SECRET_KEY',
+)
+_ENV = types.MappingProxyType({k: os.environ[k] for k in REQUIRED_KEYS if k in os.environ})
+
+
+# LangChain's import graph is heavy, so these are only imported on first use
+@lru_cache(maxsize=None)
+def _openrouter_cls():
+    from src.agents.base_agent import OpenRouterLLM
+    return OpenRouterLLM
+
+
+@lru_cache(maxsize=None)
+def _gemini_cls():
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    return ChatGoogleGenerativeAI
+
+
+@lru_cache(maxsize=None)
+def _human_message_cls():
+    from langchain_core.messages import HumanMessage
+    return HumanMessage
+
+
 def test_environment_variables():
     """Test that all required environment variables are set"""
     print("\n🔍 Testing Environment Variables...")
@@ -33,7 +73,7 @@ def test_environment_variables():
     
     all_set = True
     for var, name in required_vars.items():
-        value = os.getenv(var)
+        value = _ENV.get(var)
         if value and value != 'test-key':
             print(f"  ✅ {name}: Configured")
         else:
@@ -45,7 +85,8 @@ def test_environment_variables():
 
 async def test_redis_connection():
     """Test Redis connection"""
-    print("\n🔍 Testing Redis Connection...")
+    # Buffered so the output does not interleave with the other concurrent probes
+    lines = ["\n🔍 Testing Redis Connection..."]
     
     try:
         from src.core.redis import init_redis, cache
@@ -59,25 +100,28 @@ async def test_redis_connection():
         result = await cache.get(test_key)
         
         if result and result.get("status") == "working":
-            print("  ✅ Redis: Connected and working")
+            lines.append("  ✅ Redis: Connected and working")
             await cache.delete(test_key)
             return True
         else:
-            print("  ❌ Redis: Connection failed")
+            lines.append("  ❌ Redis: Connection failed")
             return False
             
     except Exception as e:
-        print(f"  ❌ Redis: Error - {str(e)}")
+        lines.append(f"  ❌ Redis: Error - {str(e)}")
         return False
+    finally:
+        emit(*lines)
 
 
 async def test_openrouter_models():
     """Test OpenRouter API"""
-    print("\n🔍 Testing OpenRouter Models...")
+    # Buffered so the output does not interleave with the other concurrent probes
+    lines = ["\n🔍 Testing OpenRouter Models..."]
     
     try:
-        from src.agents.base_agent import OpenRouterLLM
-        from langchain_core.messages import HumanMessage
+        OpenRouterLLM = _openrouter_cls()
+        HumanMessage = _human_message_cls()
         
         models = [
             ("anthropic/claude-3-haiku", "Claude 3 Haiku"),
@@ -85,45 +129,59 @@ async def test_openrouter_models():
             ("meta-llama/llama-3-8b-instruct", "Llama 3 8B")
         ]
         
-        all_working = True
-        for model_name, display_name in models:
-            try:
-                llm = OpenRouterLLM(model=model_name, max_tokens=50)
-                response = await llm.ainvoke([
-                    HumanMessage(content="Say 'OK' if you're working")
-                ])
-                
-                if response and response.content:
-                    print(f"  ✅ {display_name}: Working")
-                else:
-                    print(f"  ❌ {display_name}: No response")
-                    all_working = False
+        # Guard against OpenRouter QPS limits while probing in parallel
+        semaphore = asyncio.Semaphore(3)
+        
+        async def probe(model_name, display_name):
+            async with semaphore:
+                try:
+                    llm = OpenRouterLLM(model=model_name, max_tokens=50)
+                    response = await llm.ainvoke([
+                        HumanMessage(content="Say 'OK' if you're working")
+                    ])
                     
-            except Exception as e:
-                if "rate limit" in str(e).lower():
-                    print(f"  ⚠️  {display_name}: Rate limited (but configured)")
-                else:
-                    print(f"  ❌ {display_name}: Error - {str(e)[:50]}")
-                    all_working = False
+                    if response and response.content:
+                        lines.append(f"  ✅ {display_name}: Working")
+                        return True
+                    else:
+                        lines.append(f"  ❌ {display_name}: No response")
+                        return False
+                        
+                except Exception as e:
+                    if "rate limit" in str(e).lower():
+                        lines.append(f"  ⚠️  {display_name}: Rate limited (but configured)")
+                        return True
+                    else:
+                        lines.append(f"  ❌ {display_name}: Error - {str(e)[:50]}")
+                        return False
+        
+        results = await asyncio.gather(
+            *[probe(model_name, display_name) for model_name, display_name in models],
+            return_exceptions=True
+        )
+        all_working = all(result is True for result in results)
         
         return all_working
         
     except Exception as e:
-        print(f"  ❌ OpenRouter: Error - {str(e)}")
+        lines.append(f"  ❌ OpenRouter: Error - {str(e)}")
         return False
+    finally:
+        emit(*lines)
 
 
 async def test_gemini_model():
     """Test Google Gemini API"""
-    print("\n🔍 Testing Google Gemini...")
+    # Buffered so the output does not interleave with the other concurrent probes
+    lines = ["\n🔍 Testing Google Gemini..."]
     
     try:
-        from langchain_google_genai import ChatGoogleGenerativeAI
-        from langchain_core.messages import HumanMessage
+        ChatGoogleGenerativeAI = _gemini_cls()
+        HumanMessage = _human_message_cls()
         
         llm = ChatGoogleGenerativeAI(
             model="gemini-2.5-flash",
-            google_api_key=os.getenv('GOOGLE_API_KEY'),
+            google_api_key=_ENV.get('GOOGLE_API_KEY'),
             max_output_tokens=50
         )
         
@@ -132,44 +190,47 @@ async def test_gemini_model():
         ])
         
         if response and response.content:
-            print(f"  ✅ Gemini 2.5 Flash: Working")
+            lines.append(f"  ✅ Gemini 2.5 Flash: Working")
             return True
         else:
-            print(f"  ❌ Gemini: No response")
+            lines.append(f"  ❌ Gemini: No response")
             return False
             
     except Exception as e:
-        print(f"  ❌ Gemini: Error - {str(e)[:100]}")
+        lines.append(f"  ❌ Gemini: Error - {str(e)[:100]}")
         return False
+    finally:
+        emit(*lines)
 
 
-def test_database():
+async def test_database():
     """Test database connection"""
-    print("\n🔍 Testing Database...")
+    # Buffered so the output does not interleave with the other concurrent probes
+    lines = ["\n🔍 Testing Database..."]
     
     try:
-        import sqlite3
-        db_url = os.getenv('DATABASE_URL', 'sqlite:///./orbit_dev.db')
+        import aiosqlite
+        db_url = _ENV.get('DATABASE_URL', 'sqlite:///./orbit_dev.db')
         db_path = db_url.replace('sqlite:///', '')
         
-        # Test connection
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1")
-        result = cursor.fetchone()
-        conn.close()
+        # Test connection without blocking the event loop
+        async with aiosqlite.connect(db_path) as conn:
+            async with conn.execute("SELECT 1") as cursor:
+                result = await cursor.fetchone()
         
         if result:
-            print(f"  ✅ SQLite: Connected ({db_path})")
-            print(f"  ℹ️  SQLite handles up to 10K users perfectly!")
+            lines.append(f"  ✅ SQLite: Connected ({db_path})")
+            lines.append(f"  ℹ️  SQLite handles up to 10K users perfectly!")
             return True
         else:
-            print(f"  ❌ SQLite: Connection failed")
+            lines.append(f"  ❌ SQLite: Connection failed")
             return False
             
     except Exception as e:
-        print(f"  ❌ Database: Error - {str(e)}")
+        lines.append(f"  ❌ Database: Error - {str(e)}")
         return False
+    finally:
+        emit(*lines)
 
 
 def test_opik_config():
@@ -177,14 +238,16 @@ def test_opik_config():
     print("\n🔍 Testing Opik Configuration...")
     
     try:
-        api_key = os.getenv('OPIK_API_KEY')
-        project = os.getenv('OPIK_PROJECT_NAME')
-        workspace = os.getenv('OPIK_WORKSPACE')
+        api_key = _ENV.get('OPIK_API_KEY')
+        project = _ENV.get('OPIK_PROJECT_NAME')
+        workspace = _ENV.get('OPIK_WORKSPACE')
         
         if api_key and api_key != 'test-key':
-            print(f"  ✅ Opik API Key: Configured")
-            print(f"  ✅ Project: {project}")
-            print(f"  ✅ Workspace: {workspace}")
+            emit(
+                f"  ✅ Opik API Key: Configured",
+                f"  ✅ Project: {project}",
+                f"  ✅ Workspace: {workspace}",
+            )
             return True
         else:
             print(f"  ❌ Opik: Not configured")
@@ -197,34 +260,41 @@ def test_opik_config():
 
 async def main():
     """Run all tests"""
-    print("=" * 60)
-    print("🚀 ORBIT Complete Setup Verification")
-    print("=" * 60)
-    
-    results = {}
-    
-    # Test environment variables
-    results['env'] = test_environment_variables()
+    emit(
+        _EQ,
+        "🚀 ORBIT Complete Setup Verification",
+        _EQ,
+    )
     
-    # Test database
-    results['database'] = test_database()
+    # Test environment variables and Opik (local checks)
+    env_ok = test_environment_variables()
+    opik_ok = test_opik_config()
     
-    # Test Redis
-    results['redis'] = await test_redis_connection()
+    # Test database, Redis, Gemini and OpenRouter (may be rate limited) concurrently
+    database_ok, redis_ok, gemini_ok, openrouter_ok = await asyncio.gather(
+        test_database(),
+        test_redis_connection(),
+        test_gemini_model(),
+        test_openrouter_models(),
+        return_exceptions=True
+    )
     
-    # Test Opik
-    results['opik'] = test_opik_config()
-    
-    # Test Gemini
-    results['gemini'] = await test_gemini_model()
-    
-    # Test OpenRouter (may be rate limited)
-    results['openrouter'] = await test_openrouter_models()
+    # Summary keeps the original component order
+    results = {
+        'env': env_ok,
+        'database': database_ok is True,
+        'redis': redis_ok is True,
+        'opik': opik_ok,
+        'gemini': gemini_ok is True,
+        'openrouter': openrouter_ok is True,
+    }
     
     # Summary
-    print("\n" + "=" * 60)
-    print("📊 SUMMARY")
-    print("=" * 60)
+    emit(
+        "\n" + _EQ,
+        "📊 SUMMARY",
+        _EQ,
+    )
     
     total = len(results)
     passed = sum(1 for v in results.values() if v)
@@ -233,18 +303,22 @@ async def main():
         status_icon = "✅" if status else "❌"
         print(f"{status_icon} {component.upper()}: {'PASSED' if status else 'FAILED'}")
     
-    print("\n" + "=" * 60)
-    print(f"🎯 RESULT: {passed}/{total} components working")
+    emit(
+        "\n" + _EQ,
+        f"🎯 RESULT: {passed}/{total} components working",
+    )
     
     if passed == total:
         print("🎉 ALL SYSTEMS OPERATIONAL - READY TO LAUNCH!")
     elif passed >= total - 1:
-        print("✅ CORE SYSTEMS OPERATIONAL - READY TO RUN!")
-        print("   (Some optional features may need configuration)")
+        emit(
+            "✅ CORE SYSTEMS OPERATIONAL - READY TO RUN!",
+            "   (Some optional features may need configuration)",
+        )
     else:
         print("⚠️  SOME SYSTEMS NEED ATTENTION")
     
-    print("=" * 60)
+    print(_EQ)
     
     return passed >= total - 1
 
@@ -8,6 +8,7 @@ from dotenv import load_dotenv
 import os
 import sys
 from pathlib import Path
+from _output import emit
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -17,18 +18,28 @@ sys.path.insert(0, str(project_root))
 env_path = project_root / '.env.local'
 load_dotenv(env_path)
 
-print(f"Loading environment from: {env_path}")
-print(f"File exists: {env_path.exists()}")
+# Separator lines, built once
+_EQ = "=" * 70
+_DASH = "-" * 70
+
+emit(
+    f"Loading environment from: {env_path}",
+    f"File exists: {env_path.exists()}",
+)
 
 def test_email_config():
     """Test email configuration"""
-    print("=" * 70)
-    print("📧 ORBIT EMAIL CONFIGURATION TEST")
-    print("=" * 70)
+    emit(
+        _EQ,
+        "📧 ORBIT EMAIL CONFIGURATION TEST",
+        _EQ,
+    )
     
     # Check environment variables
-    print("\n1️⃣  Checking Email Configuration...")
-    print("-" * 70)
+    emit(
+        "\n1️⃣  Checking Email Configuration...",
+        _DASH,
+    )
     
     smtp_host = os.getenv('SMTP_HOST')
     smtp_port = os.getenv('SMTP_PORT')
@@ -65,8 +76,10 @@ def test_email_config():
     print(f"✅ From Name: {from_name}")
     
     # Test SMTP connection
-    print("\n2️⃣  Testing SMTP Connection...")
-    print("-" * 70)
+    emit(
+        "\n2️⃣  Testing SMTP Connection...",
+        _DASH,
+    )
     
     if not all([smtp_host, smtp_port, smtp_user, smtp_password]):
         print("❌ Cannot test connection - missing configuration")
@@ -93,14 +106,16 @@ def test_email_config():
         connection_success = True
         
     except smtplib.SMTPAuthenticationError as e:
-        print(f"❌ Authentication failed: {str(e)}")
-        print("\n💡 Troubleshooting:")
-        print("   • Check if your email password is correct")
-        print("   • For Gmail, you may need an 'App Password':")
-        print("     1. Go to Google Account settings")
-        print("     2. Security > 2-Step Verification")
-        print("     3. App passwords > Generate new password")
-        print("     4. Use that password instead of your regular password")
+        emit(
+            f"❌ Authentication failed: {str(e)}",
+            "\n💡 Troubleshooting:",
+            "   • Check if your email password is correct",
+            "   • For Gmail, you may need an 'App Password':",
+            "     1. Go to Google Account settings",
+            "     2. Security > 2-Step Verification",
+            "     3. App passwords > Generate new password",
+            "     4. Use that password instead of your regular password",
+        )
         connection_success = False
         
     except Exception as e:
@@ -108,8 +123,10 @@ def test_email_config():
         connection_success = False
     
     # Test sending email (optional)
-    print("\n3️⃣  Send Test Email?")
-    print("-" * 70)
+    emit(
+        "\n3️⃣  Send Test Email?",
+        _DASH,
+    )
     
     if connection_success:
         send_test = input("Send a test email to yourself? (y/n): ").lower().strip()
@@ -197,8 +214,10 @@ The ORBIT Team
                 )
                 
                 if success:
-                    print("✅ Test email sent successfully!")
-                    print(f"📬 Check your inbox at {smtp_user}")
+                    emit(
+                        "✅ Test email sent successfully!",
+                        f"📬 Check your inbox at {smtp_user}",
+                    )
                 else:
                     print("❌ Failed to send test email")
                     
@@ -206,24 +225,30 @@ The ORBIT Team
                 print(f"❌ Error sending test email: {str(e)}")
     
     # Summary
-    print("\n" + "=" * 70)
-    print("📊 SUMMARY")
-    print("=" * 70)
+    emit(
+        "\n" + _EQ,
+        "📊 SUMMARY",
+        _EQ,
+    )
     
     if connection_success:
-        print("\n✅ Email Configuration: WORKING")
-        print("\n🎉 Your ORBIT platform can now send emails!")
-        print("\nEmail Features Available:")
-        print("  • Welcome emails for new users")
-        print("  • Email verification")
-        print("  • Password reset")
-        print("  • Intervention notifications")
-        print("  • Goal milestone alerts")
+        emit(
+            "\n✅ Email Configuration: WORKING",
+            "\n🎉 Your ORBIT platform can now send emails!",
+            "\nEmail Features Available:",
+            "  • Welcome emails for new users",
+            "  • Email verification",
+            "  • Password reset",
+            "  • Intervention notifications",
+            "  • Goal milestone alerts",
+        )
     else:
-        print("\n⚠️  Email Configuration: NEEDS ATTENTION")
-        print("\nPlease fix the configuration issues above.")
+        emit(
+            "\n⚠️  Email Configuration: NEEDS ATTENTION",
+            "\nPlease fix the configuration issues above.",
+        )
     
-    print("\n" + "=" * 70)
+    print("\n" + _EQ)
     
     return connection_success
 
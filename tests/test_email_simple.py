@@ -3,18 +3,19 @@ Simple Email Test
 Quick test of SMTP configuration
 """
 
-import smtplib
+import asyncio
+import aiosmtplib
+import sys
 from email.mime.text import MIMEText
 from dotenv import load_dotenv
 import os
 
+from _smtp import smtp_session
+from _output import emit
+
 # Load environment
 load_dotenv('.env.local')
 
-print("=" * 70)
-print("📧 SIMPLE EMAIL TEST")
-print("=" * 70)
-
 # Get configuration
 smtp_host = os.getenv('SMTP_HOST', 'smtp.gmail.com')
 smtp_port = int(os.getenv('SMTP_PORT', '587'))
@@ -22,85 +23,105 @@ smtp_user = os.getenv('SMTP_USER')
 smtp_password = os.getenv('SMTP_PASSWORD')
 from_email = os.getenv('FROM_EMAIL', smtp_user)
 
-print(f"\nConfiguration:")
-print(f"  Host: {smtp_host}")
-print(f"  Port: {smtp_port}")
-print(f"  User: {smtp_user}")
-print(f"  Password: {'*' * len(smtp_password) if smtp_password else 'Not set'}")
-print(f"  From: {from_email}")
-
-if not all([smtp_user, smtp_password]):
-    print("\n❌ Missing SMTP credentials!")
-    exit(1)
+# Separator lines, built once
+_EQ = "=" * 70
+_DASH = "-" * 70
 
-print("\n" + "-" * 70)
-print("Testing SMTP connection...")
-print("-" * 70)
-
-try:
-    # Create connection
-    print(f"\n1. Connecting to {smtp_host}:{smtp_port}...")
-    server = smtplib.SMTP(smtp_host, smtp_port, timeout=30)
-    print("   ✅ Connected")
-    
-    # Start TLS
-    print("\n2. Starting TLS encryption...")
-    server.starttls()
-    print("   ✅ TLS enabled")
-    
-    # Login
-    print("\n3. Authenticating...")
-    server.login(smtp_user, smtp_password)
-    print("   ✅ Authentication successful!")
+async def test_simple():
+    """Send a test email over STARTTLS"""
+    emit(
+        _EQ,
+        "📧 SIMPLE EMAIL TEST",
+        _EQ,
+        f"\nConfiguration:",
+        f"  Host: {smtp_host}",
+        f"  Port: {smtp_port}",
+        f"  User: {smtp_user}",
+        f"  Password: {'*' * len(smtp_password) if smtp_password else 'Not set'}",
+        f"  From: {from_email}",
+    )
     
-    # Send test email
-    print("\n4. Sending test email...")
-    msg = MIMEText("This is a test email from ORBIT AI Platform.\n\nIf you receive this, your email configuration is working!")
-    msg['Subject'] = '🎉 ORBIT Email Test - Success!'
-    msg['From'] = from_email
-    msg['To'] = smtp_user
+    if not all([smtp_user, smtp_password]):
+        print("\n❌ Missing SMTP credentials!")
+        return False
     
-    server.sendmail(from_email, [smtp_user], msg.as_string())
-    print("   ✅ Email sent!")
+    emit(
+        "\n" + _DASH,
+        "Testing SMTP connection...",
+        _DASH,
+    )
     
-    # Close connection
-    server.quit()
+    try:
+        # Connect and authenticate, retrying transient failures
+        print(f"\n1. Connecting to {smtp_host}:{smtp_port} and authenticating...")
+        async with smtp_session(smtp_host, smtp_port, smtp_user, smtp_password, use_ssl=False) as server:
+            print("   ✅ Connected, TLS enabled and authenticated")
+            
+            # Send test email
+            msg = MIMEText("This is a test email from ORBIT AI Platform.\n\nIf you receive this, your email configuration is working!")
+            msg['Subject'] = '🎉 ORBIT Email Test - Success!'
+            msg['From'] = from_email
+            msg['To'] = smtp_user
+            print("\n2. Sending test email...")
+            await server.sendmail(from_email, [smtp_user], msg.as_bytes())
+            print("   ✅ Email sent!")
+        
+        emit(
+            "\n" + _EQ,
+            "✅ SUCCESS! Email configuration is working!",
+            _EQ,
+            f"\n📬 Check your inbox at {smtp_user}",
+            "\n",
+        )
+        return True
+        
+    except aiosmtplib.SMTPAuthenticationError as e:
+        emit(
+            f"\n❌ Authentication failed!",
+            f"   Error: {str(e)}",
+            "\n💡 Troubleshooting:",
+            "   For Gmail (@gmail.com or institutional Gmail):",
+            "   1. Enable 2-Step Verification in Google Account",
+            "   2. Generate an App Password:",
+            "      • Go to: https://myaccount.google.com/apppasswords",
+            "      • Select 'Mail' and your device",
+            "      • Copy the 16-character password",
+            "      • Use that password in SMTP_PASSWORD",
+            "\n   For institutional email (@nith.ac.in):",
+            "   • Check if your institution uses Gmail",
+            "   • You may need to enable 'Less secure app access'",
+            "   • Or use an App Password (recommended)",
+        )
+        
+    except TimeoutError:
+        emit(
+            f"\n❌ Connection timed out!",
+            "\n💡 Possible causes:",
+            "   • Firewall blocking port 587",
+            "   • Network restrictions",
+            "   • VPN interference",
+            "   • Try port 465 with SSL instead",
+        )
+        
+    except aiosmtplib.SMTPException as e:
+        print(f"\n❌ SMTP Error: {str(e)}")
+        
+    except Exception as e:
+        emit(
+            f"\n❌ Error: {str(e)}",
+            f"   Type: {type(e).__name__}",
+        )
     
-    print("\n" + "=" * 70)
-    print("✅ SUCCESS! Email configuration is working!")
-    print("=" * 70)
-    print(f"\n📬 Check your inbox at {smtp_user}")
+    return False
+
+async def main():
+    # --all also runs the SSL test; the two SMTP sessions handshake concurrently
+    if "--all" in sys.argv:
+        from test_email_ssl import test_ssl
+        await asyncio.gather(test_simple(), test_ssl())
+    else:
+        await test_simple()
     print("\n")
-    
-except smtplib.SMTPAuthenticationError as e:
-    print(f"\n❌ Authentication failed!")
-    print(f"   Error: {str(e)}")
-    print("\n💡 Troubleshooting:")
-    print("   For Gmail (@gmail.com or institutional Gmail):")
-    print("   1. Enable 2-Step Verification in Google Account")
-    print("   2. Generate an App Password:")
-    print("      • Go to: https://myaccount.google.com/apppasswords")
-    print("      • Select 'Mail' and your device")
-    print("      • Copy the 16-character password")
-    print("      • Use that password in SMTP_PASSWORD")
-    print("\n   For institutional email (@nith.ac.in):")
-    print("   • Check if your institution uses Gmail")
-    print("   • You may need to enable 'Less secure app access'")
-    print("   • Or use an App Password (recommended)")
-    
-except smtplib.SMTPException as e:
-    print(f"\n❌ SMTP Error: {str(e)}")
-    
-except TimeoutError:
-    print(f"\n❌ Connection timed out!")
-    print("\n💡 Possible causes:")
-    print("   • Firewall blocking port 587")
-    print("   • Network restrictions")
-    print("   • VPN interference")
-    print("   • Try port 465 with SSL instead")
-    
-except Exception as e:
-    print(f"\n❌ Error: {str(e)}")
-    print(f"   Type: {type(e).__name__}")
 
-print("\n")
+if __name__ == "__main__":
+    asyncio.run(main())
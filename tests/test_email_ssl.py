@@ -3,18 +3,18 @@ Email Test with SSL (Port 465)
 Alternative to TLS on port 587
 """
 
-import smtplib
+import asyncio
+import aiosmtplib
 from email.mime.text import MIMEText
 from dotenv import load_dotenv
 import os
 
+from _smtp import smtp_session
+from _output import emit
+
 # Load environment
 load_dotenv('.env.local')
 
-print("=" * 70)
-print("📧 EMAIL TEST - SSL (Port 465)")
-print("=" * 70)
-
 # Get configuration
 smtp_host = os.getenv('SMTP_HOST', 'smtp.gmail.com')
 smtp_port = 465  # SSL port
@@ -22,81 +22,101 @@ smtp_user = os.getenv('SMTP_USER')
 smtp_password = os.getenv('SMTP_PASSWORD')
 from_email = os.getenv('FROM_EMAIL', smtp_user)
 
-print(f"\nConfiguration:")
-print(f"  Host: {smtp_host}")
-print(f"  Port: {smtp_port} (SSL)")
-print(f"  User: {smtp_user}")
-print(f"  Password: {'*' * len(smtp_password) if smtp_password else 'Not set'}")
-print(f"  From: {from_email}")
-
-if not all([smtp_user, smtp_password]):
-    print("\n❌ Missing SMTP credentials!")
-    exit(1)
+# Separator lines, built once
+_EQ = "=" * 70
+_DASH = "-" * 70
 
-print("\n" + "-" * 70)
-print("Testing SMTP connection with SSL...")
-print("-" * 70)
-
-try:
-    # Create SSL connection
-    print(f"\n1. Connecting to {smtp_host}:{smtp_port} with SSL...")
-    server = smtplib.SMTP_SSL(smtp_host, smtp_port, timeout=30)
-    print("   ✅ Connected with SSL")
-    
-    # Login
-    print("\n2. Authenticating...")
-    server.login(smtp_user, smtp_password)
-    print("   ✅ Authentication successful!")
+async def test_ssl():
+    """Send a test email over implicit SSL"""
+    emit(
+        _EQ,
+        "📧 EMAIL TEST - SSL (Port 465)",
+        _EQ,
+        f"\nConfiguration:",
+        f"  Host: {smtp_host}",
+        f"  Port: {smtp_port} (SSL)",
+        f"  User: {smtp_user}",
+        f"  Password: {'*' * len(smtp_password) if smtp_password else 'Not set'}",
+        f"  From: {from_email}",
+    )
     
-    # Send test email
-    print("\n3. Sending test email...")
-    msg = MIMEText("This is a test email from ORBIT AI Platform using SSL.\n\nIf you receive this, your email configuration is working!")
-    msg['Subject'] = '🎉 ORBIT Email Test - SSL Success!'
-    msg['From'] = from_email
-    msg['To'] = smtp_user
+    if not all([smtp_user, smtp_password]):
+        print("\n❌ Missing SMTP credentials!")
+        return False
     
-    server.sendmail(from_email, [smtp_user], msg.as_string())
-    print("   ✅ Email sent!")
+    emit(
+        "\n" + _DASH,
+        "Testing SMTP connection with SSL...",
+        _DASH,
+    )
     
-    # Close connection
-    server.quit()
+    try:
+        # Connect and authenticate, retrying transient failures
+        print(f"\n1. Connecting to {smtp_host}:{smtp_port} with SSL and authenticating...")
+        async with smtp_session(smtp_host, smtp_port, smtp_user, smtp_password, use_ssl=True) as server:
+            print("   ✅ Connected with SSL and authenticated")
+            
+            # Send test email
+            msg = MIMEText("This is a test email from ORBIT AI Platform using SSL.\n\nIf you receive this, your email configuration is working!")
+            msg['Subject'] = '🎉 ORBIT Email Test - SSL Success!'
+            msg['From'] = from_email
+            msg['To'] = smtp_user
+            print("\n2. Sending test email...")
+            await server.sendmail(from_email, [smtp_user], msg.as_bytes())
+            print("   ✅ Email sent!")
+        
+        emit(
+            "\n" + _EQ,
+            "✅ SUCCESS! Email configuration is working with SSL!",
+            _EQ,
+            f"\n📬 Check your inbox at {smtp_user}",
+            "\n💡 Update .env.local to use port 465 for production",
+            "\n",
+        )
+        return True
+        
+    except aiosmtplib.SMTPAuthenticationError as e:
+        emit(
+            f"\n❌ Authentication failed!",
+            f"   Error: {str(e)}",
+            "\n💡 Troubleshooting:",
+            "   For Gmail (@gmail.com or institutional Gmail):",
+            "   1. Enable 2-Step Verification in Google Account",
+            "   2. Generate an App Password:",
+            "      • Go to: https://myaccount.google.com/apppasswords",
+            "      • Select 'Mail' and your device",
+            "      • Copy the 16-character password",
+            "      • Use that password in SMTP_PASSWORD",
+            "\n   For institutional email (@nith.ac.in):",
+            "   • Check if your institution uses Gmail",
+            "   • You may need to enable 'Less secure app access'",
+            "   • Or use an App Password (recommended)",
+        )
+        
+    except TimeoutError:
+        emit(
+            f"\n❌ Connection timed out!",
+            "\n💡 Possible causes:",
+            "   • Firewall blocking port 465",
+            "   • Network restrictions",
+            "   • VPN interference",
+            "   • Institution blocking external SMTP",
+        )
+        
+    except aiosmtplib.SMTPException as e:
+        print(f"\n❌ SMTP Error: {str(e)}")
+        
+    except Exception as e:
+        emit(
+            f"\n❌ Error: {str(e)}",
+            f"   Type: {type(e).__name__}",
+        )
     
-    print("\n" + "=" * 70)
-    print("✅ SUCCESS! Email configuration is working with SSL!")
-    print("=" * 70)
-    print(f"\n📬 Check your inbox at {smtp_user}")
-    print("\n💡 Update .env.local to use port 465 for production")
+    return False
+
+async def main():
+    await test_ssl()
     print("\n")
-    
-except smtplib.SMTPAuthenticationError as e:
-    print(f"\n❌ Authentication failed!")
-    print(f"   Error: {str(e)}")
-    print("\n💡 Troubleshooting:")
-    print("   For Gmail (@gmail.com or institutional Gmail):")
-    print("   1. Enable 2-Step Verification in Google Account")
-    print("   2. Generate an App Password:")
-    print("      • Go to: https://myaccount.google.com/apppasswords")
-    print("      • Select 'Mail' and your device")
-    print("      • Copy the 16-character password")
-    print("      • Use that password in SMTP_PASSWORD")
-    print("\n   For institutional email (@nith.ac.in):")
-    print("   • Check if your institution uses Gmail")
-    print("   • You may need to enable 'Less secure app access'")
-    print("   • Or use an App Password (recommended)")
-    
-except smtplib.SMTPException as e:
-    print(f"\n❌ SMTP Error: {str(e)}")
-    
-except TimeoutError:
-    print(f"\n❌ Connection timed out!")
-    print("\n💡 Possible causes:")
-    print("   • Firewall blocking port 465")
-    print("   • Network restrictions")
-    print("   • VPN interference")
-    print("   • Institution blocking external SMTP")
-    
-except Exception as e:
-    print(f"\n❌ Error: {str(e)}")
-    print(f"   Type: {type(e).__name__}")
 
-print("\n")
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,10 +7,14 @@ import asyncio
 import os
 from dotenv import load_dotenv
 import google.generativeai as genai
+from _output import emit
 
 # Load environment variables
 load_dotenv('.env.local')
 
+# Separator lines, built once
+_DASH = "-" * 60
+
 async def check_gemini_models():
     """Check available Gemini models"""
     
@@ -20,9 +24,11 @@ async def check_gemini_models():
         print("❌ No Google API key found")
         return
     
-    print("🔍 Checking available Gemini models...")
-    print(f"API Key: {api_key[:20]}...")
-    print("-" * 60)
+    emit(
+        "🔍 Checking available Gemini models...",
+        f"API Key: {api_key[:20]}...",
+        _DASH,
+    )
     
     try:
         genai.configure(api_key=api_key)
@@ -30,17 +36,21 @@ async def check_gemini_models():
         # List available models
         models = genai.list_models()
         
-        print("📋 Available Gemini models:")
-        print("-" * 60)
+        emit(
+            "📋 Available Gemini models:",
+            _DASH,
+        )
         
         for model in models:
             if 'generateContent' in model.supported_generation_methods:
-                print(f"🤖 {model.name}")
-                print(f"   Display Name: {model.display_name}")
-                print(f"   Description: {model.description}")
-                print(f"   Input Token Limit: {model.input_token_limit:,}")
-                print(f"   Output Token Limit: {model.output_token_limit:,}")
-                print()
+                emit(
+                    f"🤖 {model.name}",
+                    f"   Display Name: {model.display_name}",
+                    f"   Description: {model.description}",
+                    f"   Input Token Limit: {model.input_token_limit:,}",
+                    f"   Output Token Limit: {model.output_token_limit:,}",
+                    "",
+                )
                 
     except Exception as e:
         print(f"❌ Error checking models: {str(e)}")
@@ -59,8 +69,10 @@ async def test_gemini_models():
         "gemini-1.0-pro"
     ]
     
-    print("\n🧪 Testing Gemini models...")
-    print("-" * 60)
+    emit(
+        "\n🧪 Testing Gemini models...",
+        _DASH,
+    )
     
     for model_name in test_models:
         try:
@@ -7,16 +7,22 @@ import asyncio
 import httpx
 from dotenv import load_dotenv
 import os
+from _output import emit
 
 # Load environment
 load_dotenv('.env.local')
 
+# Separator lines, built once
+_EQ = "=" * 70
+
 async def test_monitoring():
     """Test monitoring endpoints"""
     
-    print("=" * 70)
-    print("🔍 ORBIT MONITORING TEST")
-    print("=" * 70)
+    emit(
+        _EQ,
+        "🔍 ORBIT MONITORING TEST",
+        _EQ,
+    )
     
     base_url = "http://localhost:8000"
     
@@ -27,19 +33,25 @@ async def test_monitoring():
             response = await client.get(f"{base_url}/")
             if response.status_code == 200:
                 data = response.json()
-                print(f"   ✅ Server is running")
-                print(f"   📊 Version: {data.get('version')}")
-                print(f"   🌍 Environment: {data.get('environment')}")
+                emit(
+                    f"   ✅ Server is running",
+                    f"   📊 Version: {data.get('version')}",
+                    f"   🌍 Environment: {data.get('environment')}",
+                )
                 
                 monitoring = data.get('monitoring', {})
-                print(f"   🔍 Sentry: {monitoring.get('sentry', 'unknown')}")
-                print(f"   🤖 Opik: {monitoring.get('opik', 'unknown')}")
+                emit(
+                    f"   🔍 Sentry: {monitoring.get('sentry', 'unknown')}",
+                    f"   🤖 Opik: {monitoring.get('opik', 'unknown')}",
+                )
             else:
                 print(f"   ❌ Server returned status {response.status_code}")
                 return False
     except Exception as e:
-        print(f"   ❌ Server not running: {str(e)}")
-        print(f"   💡 Start server with: python -m uvicorn src.main:app --reload")
+        emit(
+            f"   ❌ Server not running: {str(e)}",
+            f"   💡 Start server with: python -m uvicorn src.main:app --reload",
+        )
         return False
     
     # Check health endpoint
@@ -49,8 +61,10 @@ async def test_monitoring():
             response = await client.get(f"{base_url}/health")
             if response.status_code == 200:
                 data = response.json()
-                print(f"   ✅ Health check passed")
-                print(f"   📊 Status: {data.get('status')}")
+                emit(
+                    f"   ✅ Health check passed",
+                    f"   📊 Status: {data.get('status')}",
+                )
                 
                 services = data.get('services', {})
                 for service, info in services.items():
@@ -69,29 +83,37 @@ async def test_monitoring():
     opik_key = os.getenv('OPIK_API_KEY', '')
     
     if sentry_dsn and 'sentry.io' in sentry_dsn:
-        print(f"   ✅ Sentry DSN configured")
-        print(f"   🔗 DSN: {sentry_dsn[:50]}...")
+        emit(
+            f"   ✅ Sentry DSN configured",
+            f"   🔗 DSN: {sentry_dsn[:50]}...",
+        )
     else:
         print(f"   ⚠️  Sentry DSN not configured")
     
     if opik_key and opik_key != 'test-key':
-        print(f"   ✅ Opik API key configured")
-        print(f"   🔑 Key: {opik_key[:20]}...")
+        emit(
+            f"   ✅ Opik API key configured",
+            f"   🔑 Key: {opik_key[:20]}...",
+        )
     else:
         print(f"   ⚠️  Opik API key not configured")
     
     # Test Sentry debug endpoint (only if server is running)
-    print("\n4️⃣  Testing Sentry error capture...")
-    print("   ℹ️  This will trigger a test error")
+    emit(
+        "\n4️⃣  Testing Sentry error capture...",
+        "   ℹ️  This will trigger a test error",
+    )
     
     try:
         async with httpx.AsyncClient() as client:
             response = await client.get(f"{base_url}/sentry-debug")
             # This should return 500 error
             if response.status_code == 500:
-                print(f"   ✅ Test error triggered successfully")
-                print(f"   📊 Check Sentry dashboard for the error")
-                print(f"   🔗 https://sentry.io")
+                emit(
+                    f"   ✅ Test error triggered successfully",
+                    f"   📊 Check Sentry dashboard for the error",
+                    f"   🔗 https://sentry.io",
+                )
             elif response.status_code == 403:
                 print(f"   ⚠️  Debug endpoint disabled (production mode)")
             else:
@@ -100,29 +122,27 @@ async def test_monitoring():
         print(f"   ⚠️  Could not test error capture: {str(e)}")
     
     # Summary
-    print("\n" + "=" * 70)
-    print("📊 MONITORING SUMMARY")
-    print("=" * 70)
-    
-    print("\n✅ Configured:")
-    print("   • Sentry error monitoring")
-    print("   • Opik AI monitoring")
-    print("   • FastAPI automatic tracking")
-    print("   • Performance monitoring")
-    print("   • Health check endpoint")
-    
-    print("\n🎯 Next Steps:")
-    print("   1. Check Sentry dashboard: https://sentry.io")
-    print("   2. Verify test error appears in Issues")
-    print("   3. Check Performance tab for API metrics")
-    print("   4. Configure alerts in Sentry settings")
-    
-    print("\n💡 Useful Commands:")
-    print("   • Start server: python -m uvicorn src.main:app --reload")
-    print("   • Test error: curl http://localhost:8000/sentry-debug")
-    print("   • Health check: curl http://localhost:8000/health")
-    
-    print("\n" + "=" * 70)
+    emit(
+        "\n" + _EQ,
+        "📊 MONITORING SUMMARY",
+        _EQ,
+        "\n✅ Configured:",
+        "   • Sentry error monitoring",
+        "   • Opik AI monitoring",
+        "   • FastAPI automatic tracking",
+        "   • Performance monitoring",
+        "   • Health check endpoint",
+        "\n🎯 Next Steps:",
+        "   1. Check Sentry dashboard: https://sentry.io",
+        "   2. Verify test error appears in Issues",
+        "   3. Check Performance tab for API metrics",
+        "   4. Configure alerts in Sentry settings",
+        "\n💡 Useful Commands:",
+        "   • Start server: python -m uvicorn src.main:app --reload",
+        "   • Test error: curl http://localhost:8000/sentry-debug",
+        "   • Health check: curl http://localhost:8000/health",
+        "\n" + _EQ,
+    )
     
     return True
 
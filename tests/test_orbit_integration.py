@@ -6,27 +6,80 @@ Tests OpenRouter AI models and Redis caching together
 
 import asyncio
 import os
+import sys
+import time
+import types
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from dotenv import load_dotenv
+from langchain_core.messages import HumanMessage, SystemMessage
+from _output import emit
 
 # Load environment variables
 load_dotenv('.env.local')
 
+# --use-cache replays low-temperature LLM answers from Redis across runs.
+# Off by default so a provider outage is not hidden behind a cached answer.
+if '--use-cache' in sys.argv:
+    os.environ['LLM_CACHE_ENABLED'] = 'true'
+
+# Separator lines, built once
+_EQ = "=" * 60
+_DASH_SHORT = "-" * 40
+
+# Snapshot the variables these tests read so they stay fixed for the whole run
+REQUIRED_KEYS = (
+    'OPEN_ROUTER_API_KEY',
+    'GOOGLE_API_KEY',
+    'REDIS_URL',
+)
+_ENV = types.MappingProxyType({k: os.environ[k] for k in REQUIRED_KEYS if k in os.environ})
+
+# System prompts are constant, so build the message objects once
+_SUPERVISOR_SYS = SystemMessage(content="You are an AI supervisor for the ORBIT platform. Evaluate interventions for safety and effectiveness.")
+_OPTIMIZER_SYS = SystemMessage(content="You are an AI optimizer for the ORBIT platform. Suggest improvements to user interventions.")
+_WORKER_SYS = SystemMessage(content="You are an AI worker for the ORBIT platform. Generate personalized interventions to help users achieve their goals.")
+_INTERVENTION_SYS = SystemMessage(content="Generate a specific, actionable intervention using behavioral science principles.")
+_EVALUATION_SYS = SystemMessage(content="Evaluate interventions on a scale of 1-10 for safety and effectiveness.")
+
+# Cache payload timestamps are stored as epoch floats
+_now = time.time
+
+# Cap in-flight LLM requests to stay within OpenRouter rate limits
+LLM_CONCURRENCY = asyncio.Semaphore(10)
+
+
+async def _bounded(coro):
+    """Await an LLM call while holding a concurrency slot"""
+    async with LLM_CONCURRENCY:
+        return await coro
+
+
+def _cached_note(response):
+    """Label answers replayed from the LLM cache so they are not mistaken for live calls"""
+    return " (cached)" if response.response_metadata.get("cached") else ""
+
 async def test_orbit_integration():
     """Test complete ORBIT integration"""
     
-    print("🚀 ORBIT Platform Integration Test")
-    print("=" * 60)
-    print(f"Timestamp: {datetime.utcnow().isoformat()}")
-    print(f"OpenRouter API Key: {os.getenv('OPEN_ROUTER_API_KEY')[:20]}...")
-    print(f"Google API Key: {os.getenv('GOOGLE_API_KEY')[:20]}...")
-    print(f"Redis URL: {os.getenv('REDIS_URL')[:30]}...")
-    print("=" * 60)
+    emit(
+        "🚀 ORBIT Platform Integration Test",
+        _EQ,
+        f"Timestamp: {datetime.now(timezone.utc).isoformat()}",
+        f"OpenRouter API Key: {_ENV.get('OPEN_ROUTER_API_KEY')[:20]}...",
+        f"Google API Key: {_ENV.get('GOOGLE_API_KEY')[:20]}...",
+        f"Redis URL: {_ENV.get('REDIS_URL')[:30]}...",
+        _EQ,
+    )
+    
+    # Pre-generate cache key ids for the responses and workflow written below
+    supervisor_id, optimizer_id, worker_id, workflow_id = (uuid.uuid4().hex for _ in range(4))
     
     # Test 1: Redis Connection and Caching
-    print("\n📊 Test 1: Redis Integration")
-    print("-" * 40)
+    emit(
+        "\n📊 Test 1: Redis Integration",
+        _DASH_SHORT,
+    )
     
     try:
         from src.core.redis import init_redis, cache, session_manager
@@ -59,91 +112,106 @@ async def test_orbit_integration():
         return False
     
     # Test 2: OpenRouter AI Models
-    print("\n🤖 Test 2: OpenRouter AI Integration")
-    print("-" * 40)
+    emit(
+        "\n🤖 Test 2: OpenRouter AI Integration",
+        _DASH_SHORT,
+    )
     
     try:
         from src.agents.base_agent import OpenRouterLLM
-        from langchain_core.messages import HumanMessage, SystemMessage
+        from langchain_google_genai import ChatGoogleGenerativeAI
         
         # Test Supervisor Agent (Claude)
         supervisor_llm = OpenRouterLLM(
             model="anthropic/claude-3-haiku",
             temperature=0.3,
             max_tokens=100,
-            api_key=os.getenv('OPEN_ROUTER_API_KEY')
+            api_key=_ENV.get('OPEN_ROUTER_API_KEY')
         )
         
         supervisor_messages = [
-            SystemMessage(content="You are an AI supervisor for the ORBIT platform. Evaluate interventions for safety and effectiveness."),
+            _SUPERVISOR_SYS,
             HumanMessage(content="Evaluate this intervention: 'Take a 10-minute walk to boost your energy levels.'")
         ]
         
-        supervisor_response = await supervisor_llm.ainvoke(supervisor_messages)
-        print(f"✅ Supervisor Agent (Claude): {supervisor_response.content[:80]}...")
-        
-        # Cache the response
-        await cache.set(f"supervisor_response_{uuid.uuid4()}", {
-            "content": supervisor_response.content,
-            "model": "claude-3-haiku",
-            "timestamp": datetime.utcnow().isoformat()
-        }, expire=300)
-        
         # Test Optimizer Agent (GPT-3.5)
         optimizer_llm = OpenRouterLLM(
             model="openai/gpt-3.5-turbo",
             temperature=0.5,
             max_tokens=100,
-            api_key=os.getenv('OPEN_ROUTER_API_KEY')
+            api_key=_ENV.get('OPEN_ROUTER_API_KEY')
         )
         
         optimizer_messages = [
-            SystemMessage(content="You are an AI optimizer for the ORBIT platform. Suggest improvements to user interventions."),
+            _OPTIMIZER_SYS,
             HumanMessage(content="How can we improve this goal: 'Exercise more often'?")
         ]
         
-        optimizer_response = await optimizer_llm.ainvoke(optimizer_messages)
-        print(f"✅ Optimizer Agent (GPT-3.5): {optimizer_response.content[:80]}...")
-        
-        # Cache the response
-        await cache.set(f"optimizer_response_{uuid.uuid4()}", {
-            "content": optimizer_response.content,
-            "model": "gpt-3.5-turbo",
-            "timestamp": datetime.utcnow().isoformat()
-        }, expire=300)
-        
-    except Exception as e:
-        print(f"❌ OpenRouter test failed: {str(e)}")
-        return False
-    
-    # Test 3: Google Gemini Direct API
-    print("\n🌟 Test 3: Google Gemini Integration")
-    print("-" * 40)
-    
-    try:
-        from langchain_google_genai import ChatGoogleGenerativeAI
-        
-        # Test Worker Agent (Gemini)
+        # Test Worker Agent (Gemini) - checked in Test 3
         worker_llm = ChatGoogleGenerativeAI(
             model="gemini-2.5-flash",
             temperature=0.7,
             max_output_tokens=100,
-            google_api_key=os.getenv('GOOGLE_API_KEY'),
+            google_api_key=_ENV.get('GOOGLE_API_KEY'),
         )
         
         worker_messages = [
-            SystemMessage(content="You are an AI worker for the ORBIT platform. Generate personalized interventions to help users achieve their goals."),
+            _WORKER_SYS,
             HumanMessage(content="Generate a motivational intervention for someone who wants to exercise but feels tired.")
         ]
         
-        worker_response = await worker_llm.ainvoke(worker_messages)
+        # The three agent calls are independent, so run them concurrently
+        supervisor_response, optimizer_response, worker_response = await asyncio.gather(
+            _bounded(supervisor_llm.ainvoke(supervisor_messages)),
+            _bounded(optimizer_llm.ainvoke(optimizer_messages)),
+            _bounded(worker_llm.ainvoke(worker_messages)),
+            return_exceptions=True
+        )
+        
+        for response in (supervisor_response, optimizer_response):
+            if isinstance(response, BaseException):
+                raise response
+        
+        emit(
+            f"✅ Supervisor Agent (Claude){_cached_note(supervisor_response)}: {supervisor_response.content[:80]}...",
+            f"✅ Optimizer Agent (GPT-3.5){_cached_note(optimizer_response)}: {optimizer_response.content[:80]}...",
+        )
+        
+        # Cache the responses in a single round-trip
+        async with cache.pipeline() as pipe:
+            pipe.set(f"supervisor_response_{supervisor_id}", {
+                "content": supervisor_response.content,
+                "model": "claude-3-haiku",
+                "timestamp": _now()
+            }, expire=300)
+            pipe.set(f"optimizer_response_{optimizer_id}", {
+                "content": optimizer_response.content,
+                "model": "gpt-3.5-turbo",
+                "timestamp": _now()
+            }, expire=300)
+            await pipe.execute()
+        
+    except Exception as e:
+        print(f"❌ OpenRouter test failed: {str(e)}")
+        return False
+    
+    # Test 3: Google Gemini Direct API
+    emit(
+        "\n🌟 Test 3: Google Gemini Integration",
+        _DASH_SHORT,
+    )
+    
+    try:
+        if isinstance(worker_response, BaseException):
+            raise worker_response
+        
         print(f"✅ Worker Agent (Gemini): {worker_response.content[:80]}...")
         
         # Cache the response
-        await cache.set(f"worker_response_{uuid.uuid4()}", {
+        await cache.set(f"worker_response_{worker_id}", {
             "content": worker_response.content,
             "model": "gemini-2.5-flash",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _now()
         }, expire=300)
         
     except Exception as e:
@@ -151,8 +219,10 @@ async def test_orbit_integration():
         return False
     
     # Test 4: Complete Workflow Simulation
-    print("\n⚡ Test 4: Complete ORBIT Workflow")
-    print("-" * 40)
+    emit(
+        "\n⚡ Test 4: Complete ORBIT Workflow",
+        _DASH_SHORT,
+    )
     
     try:
         # Simulate a complete user interaction
@@ -161,41 +231,41 @@ async def test_orbit_integration():
         # Step 1: Worker generates intervention
         intervention_prompt = f"Generate a behavioral intervention for this goal: {user_goal}"
         worker_messages = [
-            SystemMessage(content="Generate a specific, actionable intervention using behavioral science principles."),
+            _INTERVENTION_SYS,
             HumanMessage(content=intervention_prompt)
         ]
         
-        intervention = await worker_llm.ainvoke(worker_messages)
+        intervention = await _bounded(worker_llm.ainvoke(worker_messages))
         print(f"✅ Step 1 - Intervention Generated: {intervention.content[:60]}...")
         
         # Step 2: Supervisor evaluates intervention
         evaluation_prompt = f"Evaluate this intervention for safety and effectiveness: {intervention.content}"
         supervisor_messages = [
-            SystemMessage(content="Evaluate interventions on a scale of 1-10 for safety and effectiveness."),
+            _EVALUATION_SYS,
             HumanMessage(content=evaluation_prompt)
         ]
         
-        evaluation = await supervisor_llm.ainvoke(supervisor_messages)
-        print(f"✅ Step 2 - Intervention Evaluated: {evaluation.content[:60]}...")
+        evaluation = await _bounded(supervisor_llm.ainvoke(supervisor_messages))
+        print(f"✅ Step 2 - Intervention Evaluated{_cached_note(evaluation)}: {evaluation.content[:60]}...")
         
-        # Step 3: Cache complete workflow
-        workflow_id = str(uuid.uuid4())
-        await cache.set(f"workflow_{workflow_id}", {
-            "user_goal": user_goal,
-            "intervention": intervention.content,
-            "evaluation": evaluation.content,
-            "models_used": {
-                "worker": "gemini-2.5-flash",
-                "supervisor": "claude-3-haiku"
-            },
-            "timestamp": datetime.utcnow().isoformat(),
-            "session_id": session_id
-        }, expire=3600)
+        # Step 3 & 4: Cache complete workflow and read it back in one round-trip
+        async with cache.pipeline() as pipe:
+            pipe.set(f"workflow_{workflow_id}", {
+                "user_goal": user_goal,
+                "intervention": intervention.content,
+                "evaluation": evaluation.content,
+                "models_used": {
+                    "worker": "gemini-2.5-flash",
+                    "supervisor": "claude-3-haiku"
+                },
+                "timestamp": _now(),
+                "session_id": session_id
+            }, expire=3600)
+            pipe.get(f"workflow_{workflow_id}")
+            _, cached_workflow = await pipe.execute()
         
         print(f"✅ Step 3 - Workflow Cached: {workflow_id}")
         
-        # Step 4: Retrieve and verify cached data
-        cached_workflow = await cache.get(f"workflow_{workflow_id}")
         if cached_workflow and cached_workflow["user_goal"] == user_goal:
             print("✅ Step 4 - Cache Verification Successful")
         else:
@@ -207,25 +277,32 @@ async def test_orbit_integration():
         return False
     
     # Test 5: Performance Metrics
-    print("\n📈 Test 5: Performance Metrics")
-    print("-" * 40)
+    emit(
+        "\n📈 Test 5: Performance Metrics",
+        _DASH_SHORT,
+    )
     
     try:
-        import time
+        # Write, read back and delete in one pipelined round-trip
+        async with cache.pipeline() as pipe:
+            pipe.set("perf_test", {"test": "performance"}, expire=60)
+            pipe.get("perf_test")
+            pipe.delete("perf_test")
+            
+            start_time = time.perf_counter()
+            _, cached_perf, _ = await pipe.execute()
+            pipeline_time = time.perf_counter() - start_time
         
-        # Test response times
-        start_time = time.time()
-        await cache.set("perf_test", {"test": "performance"}, expire=60)
-        cache_time = time.time() - start_time
-        print(f"✅ Redis Cache Write: {cache_time*1000:.2f}ms")
+        if cached_perf != {"test": "performance"}:
+            print("❌ Redis Pipeline Read-back Failed")
+            return False
         
-        start_time = time.time()
-        await cache.get("perf_test")
-        cache_read_time = time.time() - start_time
-        print(f"✅ Redis Cache Read: {cache_read_time*1000:.2f}ms")
+        emit(
+            f"✅ Redis Pipeline Round-trip (set/get/delete): {pipeline_time*1e3:.2f}ms",
+            f"✅ Redis Amortized Per-op: {pipeline_time*1e3/3:.2f}ms",
+        )
         
         # Clean up
-        await cache.delete("perf_test")
         await session_manager.delete_session(session_id)
         print("✅ Cleanup completed")
         
@@ -234,23 +311,25 @@ async def test_orbit_integration():
         return False
     
     # Final Results
-    print("\n🎉 ORBIT Integration Test Results")
-    print("=" * 60)
-    print("✅ Redis Integration: PASSED")
-    print("✅ OpenRouter AI Models: PASSED")
-    print("✅ Google Gemini API: PASSED")
-    print("✅ Complete Workflow: PASSED")
-    print("✅ Performance Metrics: PASSED")
-    print("\n🚀 ORBIT Platform is ready for deployment!")
-    print("\nModel Configuration:")
-    print("- Worker Agent: Google Gemini 2.5 Flash (direct API)")
-    print("- Supervisor Agent: Claude 3 Haiku (via OpenRouter)")
-    print("- Optimizer Agent: GPT-3.5 Turbo (via OpenRouter)")
-    print("- Fallback: Llama 3 8B (via OpenRouter)")
-    print("\nInfrastructure:")
-    print("- Redis: Upstash Redis (cloud-hosted)")
-    print("- Caching: Session management and AI response caching")
-    print("- API Integration: Cost-effective via OpenRouter")
+    emit(
+        "\n🎉 ORBIT Integration Test Results",
+        _EQ,
+        "✅ Redis Integration: PASSED",
+        "✅ OpenRouter AI Models: PASSED",
+        "✅ Google Gemini API: PASSED",
+        "✅ Complete Workflow: PASSED",
+        "✅ Performance Metrics: PASSED",
+        "\n🚀 ORBIT Platform is ready for deployment!",
+        "\nModel Configuration:",
+        "- Worker Agent: Google Gemini 2.5 Flash (direct API)",
+        "- Supervisor Agent: Claude 3 Haiku (via OpenRouter)",
+        "- Optimizer Agent: GPT-3.5 Turbo (via OpenRouter)",
+        "- Fallback: Llama 3 8B (via OpenRouter)",
+        "\nInfrastructure:",
+        "- Redis: Upstash Redis (cloud-hosted)",
+        "- Caching: Session management and AI response caching",
+        "- API Integration: Cost-effective via OpenRouter",
+    )
     
     return True
 
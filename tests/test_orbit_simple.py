@@ -4,42 +4,95 @@ Simple ORBIT integration test without complex configuration
 """
 
 import asyncio
+import functools
 import os
 import uuid
 from datetime import datetime
 from dotenv import load_dotenv
+import orjson
+from urllib.parse import urlparse
+from _output import emit
 
 # Load environment variables
 load_dotenv('.env.local')
 
-async def test_orbit_simple():
-    """Test ORBIT components without complex config"""
+# Separator lines, built once
+_EQ = "=" * 50
+_DASH_SHORT = "-" * 30
+
+# Parsed once at import so every test reuses the same connection settings
+_PARSED = urlparse(os.getenv('REDIS_URL', ''))
+REDIS_KW = dict(
+    host=_PARSED.hostname,
+    port=_PARSED.port,
+    username=_PARSED.username,
+    password=_PARSED.password,
+    ssl_check_hostname=False,
+    decode_responses=True
+)
+
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+@functools.lru_cache(maxsize=None)
+def _gemini_model():
+    """Configure Gemini once and share the model between tests"""
+    import google.generativeai as genai
+    
+    genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
+    return genai.GenerativeModel('gemini-2.5-flash')
+
+def _stream_gemini(prompt, label, preview=60):
+    """Stream a Gemini generation, printing a preview as soon as it arrives"""
+    text = ""
+    previewed = False
+    for chunk in _gemini_model().generate_content(prompt, stream=True):
+        text += chunk.text
+        if not previewed and len(text.strip()) >= preview:
+            print(f"{label}: {text.strip()[:preview]}...")
+            previewed = True
+    if not previewed:
+        print(f"{label}: {text.strip()}")
+    return text
+
+async def _stream_openrouter(http_client, payload, limit=100):
+    """
+    Stream an OpenRouter completion and stop once enough content has arrived.
+    Returns None when the request fails.
+    """
+    text = ""
+    async with http_client.stream(
+        "POST",
+        OPENROUTER_URL,
+        json={**payload, "stream": True}
+    ) as response:
+        if response.status_code != 200:
+            print(f"❌ Evaluation failed: {response.status_code}")
+            return None
+        
+        # SSE frames are "data: {...}"; OpenRouter also sends ": comment" keep-alives
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = line[6:]
+            if data == "[DONE]":
+                break
+            text += orjson.loads(data)["choices"][0]["delta"].get("content") or ""
+            if len(text) >= limit:
+                # Leaving the block closes the stream and frees the server-side slot
+                break
     
-    print("🚀 ORBIT Simple Integration Test")
-    print("=" * 50)
+    return text
+
+async def _test_redis(redis_client):
+    """Test 1: Redis connection and caching"""
     
-    # Test 1: Redis Direct Connection
-    print("\n📊 Test 1: Redis Connection")
-    print("-" * 30)
+    emit(
+        "\n📊 Test 1: Redis Connection",
+        _DASH_SHORT,
+    )
     
     try:
-        import redis.asyncio as redis
-        from urllib.parse import urlparse
-        
-        redis_url = os.getenv('REDIS_URL')
-        parsed = urlparse(redis_url)
-        
-        client = redis.Redis(
-            host=parsed.hostname,
-            port=parsed.port,
-            username=parsed.username,
-            password=parsed.password,
-            ssl=True,
-            ssl_check_hostname=False,
-            decode_responses=True
-        )
-        
-        await client.ping()
+        await redis_client.ping()
         print("✅ Redis connection successful")
         
         # Test caching
@@ -49,26 +102,25 @@ async def test_orbit_simple():
             "timestamp": datetime.now().isoformat()
         }
         
-        await client.set("orbit_test", str(test_data), ex=60)
-        cached_data = await client.get("orbit_test")
-        print(f"✅ Cache test: {cached_data[:50]}...")
+        await redis_client.set("orbit_test", orjson.dumps(test_data), ex=60)
+        cached_data = orjson.loads(await redis_client.get("orbit_test"))
+        print(f"✅ Cache test: {cached_data['goal']} ({cached_data['user_id']})")
         
-        await client.delete("orbit_test")
-        await client.aclose()
+        await redis_client.delete("orbit_test")
         
     except Exception as e:
         print(f"❌ Redis test failed: {str(e)}")
         return False
     
-    # Test 2: OpenRouter Models
-    print("\n🤖 Test 2: OpenRouter AI Models")
-    print("-" * 30)
+    return True
+
+async def _test_openrouter(http_client):
+    """Test 2: OpenRouter models"""
+    
+    # Buffered so the output does not interleave with the concurrent Gemini test
+    lines = ["\n🤖 Test 2: OpenRouter AI Models", _DASH_SHORT]
     
     try:
-        import httpx
-        
-        api_key = os.getenv('OPEN_ROUTER_API_KEY')
-        
         # Test Claude (Supervisor)
         payload = {
             "model": "anthropic/claude-3-haiku",
@@ -79,83 +131,80 @@ async def test_orbit_simple():
             "max_tokens": 50
         }
         
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
+        response = await http_client.post(OPENROUTER_URL, json=payload)
         
-        async with httpx.AsyncClient(timeout=30.0) as http_client:
-            response = await http_client.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                json=payload,
-                headers=headers
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-                print(f"✅ Claude (Supervisor): {content.strip()}")
-            else:
-                print(f"❌ Claude failed: {response.status_code}")
-                return False
+        if response.status_code == 200:
+            result = response.json()
+            content = result["choices"][0]["message"]["content"]
+            lines.append(f"✅ Claude (Supervisor): {content.strip()}")
+        else:
+            lines.append(f"❌ Claude failed: {response.status_code}")
+            return False
         
         # Test GPT-3.5 (Optimizer)
         payload["model"] = "openai/gpt-3.5-turbo"
         payload["messages"][1]["content"] = "Suggest one improvement for this goal: 'Exercise more.'"
         
-        async with httpx.AsyncClient(timeout=30.0) as http_client:
-            response = await http_client.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                json=payload,
-                headers=headers
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-                print(f"✅ GPT-3.5 (Optimizer): {content.strip()}")
-            else:
-                print(f"❌ GPT-3.5 failed: {response.status_code}")
-                return False
+        response = await http_client.post(OPENROUTER_URL, json=payload)
+        
+        if response.status_code == 200:
+            result = response.json()
+            content = result["choices"][0]["message"]["content"]
+            lines.append(f"✅ GPT-3.5 (Optimizer): {content.strip()}")
+        else:
+            lines.append(f"❌ GPT-3.5 failed: {response.status_code}")
+            return False
         
     except Exception as e:
-        print(f"❌ OpenRouter test failed: {str(e)}")
+        lines.append(f"❌ OpenRouter test failed: {str(e)}")
         return False
+    finally:
+        emit(*lines)
+    
+    return True
+
+async def _test_gemini():
+    """Test 3: Google Gemini"""
     
-    # Test 3: Google Gemini
-    print("\n🌟 Test 3: Google Gemini")
-    print("-" * 30)
+    lines = ["\n🌟 Test 3: Google Gemini", _DASH_SHORT]
     
     try:
-        import google.generativeai as genai
-        
-        genai.configure(api_key=os.getenv('GOOGLE_API_KEY'))
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        response = model.generate_content(
-            "Generate a motivational intervention for someone who wants to read more books. Keep it under 50 words."
+        # Model setup and the SDK call both block; run them off the loop so OpenRouter keeps progressing
+        response = await asyncio.to_thread(
+            lambda: _gemini_model().generate_content(
+                "Generate a motivational intervention for someone who wants to read more books. Keep it under 50 words."
+            )
         )
         
-        print(f"✅ Gemini (Worker): {response.text.strip()}")
+        lines.append(f"✅ Gemini (Worker): {response.text.strip()}")
         
     except Exception as e:
-        print(f"❌ Gemini test failed: {str(e)}")
+        lines.append(f"❌ Gemini test failed: {str(e)}")
         return False
+    finally:
+        emit(*lines)
     
-    # Test 4: Complete Workflow
-    print("\n⚡ Test 4: Complete Workflow")
-    print("-" * 30)
+    return True
+
+async def _test_workflow(http_client, redis_client):
+    """Test 4: Gemini -> Claude -> Redis workflow"""
+    
+    emit(
+        "\n⚡ Test 4: Complete Workflow",
+        _DASH_SHORT,
+    )
     
     try:
         # Simulate complete ORBIT workflow
         user_goal = "I want to drink more water daily"
         
         # Step 1: Generate intervention (Gemini)
-        intervention_response = model.generate_content(
-            f"Create a specific behavioral intervention for this goal: {user_goal}. Use behavioral science principles. Keep it under 100 words."
-        )
-        intervention = intervention_response.text.strip()
-        print(f"✅ Intervention: {intervention[:60]}...")
+        # Streamed so the preview prints at first tokens; the full text feeds step 2
+        intervention = (await asyncio.to_thread(
+            _stream_gemini,
+            f"Create a specific behavioral intervention for this goal: {user_goal}. Use behavioral science principles. Keep it under 100 words.",
+            "✅ Intervention"
+        )).strip()
         
         # Step 2: Evaluate intervention (Claude)
         eval_payload = {
@@ -167,20 +216,11 @@ async def test_orbit_simple():
             "max_tokens": 100
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as http_client:
-            response = await http_client.post(
-                "https://openrouter.ai/api/v1/chat/completions",
-                json=eval_payload,
-                headers=headers
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                evaluation = result["choices"][0]["message"]["content"]
-                print(f"✅ Evaluation: {evaluation.strip()[:60]}...")
-            else:
-                print(f"❌ Evaluation failed: {response.status_code}")
-                return False
+        evaluation = await _stream_openrouter(http_client, eval_payload)
+        
+        if evaluation is None:
+            return False
+        print(f"✅ Evaluation: {evaluation.strip()[:60]}...")
         
         # Step 3: Cache workflow result
         workflow_data = {
@@ -195,47 +235,82 @@ async def test_orbit_simple():
             }
         }
         
-        # Reconnect to Redis for caching
-        client = redis.Redis(
-            host=parsed.hostname,
-            port=parsed.port,
-            username=parsed.username,
-            password=parsed.password,
-            ssl=True,
-            ssl_check_hostname=False,
-            decode_responses=True
-        )
-        
-        await client.set(f"workflow_{workflow_data['id']}", str(workflow_data), ex=300)
-        cached_workflow = await client.get(f"workflow_{workflow_data['id']}")
+        await redis_client.set(f"workflow_{workflow_data['id']}", orjson.dumps(workflow_data), ex=300)
+        cached_workflow = await redis_client.get(f"workflow_{workflow_data['id']}")
         
-        if cached_workflow:
+        if cached_workflow and orjson.loads(cached_workflow)["id"] == workflow_data["id"]:
             print(f"✅ Workflow cached: {workflow_data['id']}")
         else:
             print("❌ Workflow caching failed")
             return False
         
-        await client.delete(f"workflow_{workflow_data['id']}")
-        await client.aclose()
+        await redis_client.delete(f"workflow_{workflow_data['id']}")
         
     except Exception as e:
         print(f"❌ Workflow test failed: {str(e)}")
         return False
     
+    return True
+
+async def test_orbit_simple():
+    """Test ORBIT components without complex config"""
+    
+    import httpx
+    import redis.asyncio as redis
+    
+    emit(
+        "🚀 ORBIT Simple Integration Test",
+        _EQ,
+    )
+    
+    # One pooled client shared by the cache and workflow tests
+    pool = redis.ConnectionPool(
+        connection_class=redis.SSLConnection,
+        max_connections=4,
+        **REDIS_KW
+    )
+    redis_client = redis.Redis(connection_pool=pool)
+    
+    try:
+        # One HTTP/2 client for every OpenRouter call, auth attached once
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            headers={"Authorization": f"Bearer {os.getenv('OPEN_ROUTER_API_KEY')}"}
+        ) as http_client:
+            if not await _test_redis(redis_client):
+                return False
+            
+            # OpenRouter and Gemini are independent, so overlap their round trips
+            ok_openrouter, ok_gemini = await asyncio.gather(
+                _test_openrouter(http_client),
+                _test_gemini()
+            )
+            if not (ok_openrouter and ok_gemini):
+                return False
+            
+            if not await _test_workflow(http_client, redis_client):
+                return False
+    finally:
+        await redis_client.aclose()
+        await pool.disconnect()
+    
     # Success!
-    print("\n🎉 ORBIT Integration Test Results")
-    print("=" * 50)
-    print("✅ Redis Integration: PASSED")
-    print("✅ OpenRouter Models: PASSED") 
-    print("✅ Google Gemini: PASSED")
-    print("✅ Complete Workflow: PASSED")
-    print("\n🚀 ORBIT Platform Ready!")
-    print("\nConfiguration Summary:")
-    print("- Worker: Gemini 2.5 Flash (Google Direct)")
-    print("- Supervisor: Claude 3 Haiku (OpenRouter)")
-    print("- Optimizer: GPT-3.5 Turbo (OpenRouter)")
-    print("- Cache: Upstash Redis (SSL)")
-    print("- Cost: Optimized via OpenRouter")
+    emit(
+        "\n🎉 ORBIT Integration Test Results",
+        _EQ,
+        "✅ Redis Integration: PASSED",
+        "✅ OpenRouter Models: PASSED",
+        "✅ Google Gemini: PASSED",
+        "✅ Complete Workflow: PASSED",
+        "\n🚀 ORBIT Platform Ready!",
+        "\nConfiguration Summary:",
+        "- Worker: Gemini 2.5 Flash (Google Direct)",
+        "- Supervisor: Claude 3 Haiku (OpenRouter)",
+        "- Optimizer: GPT-3.5 Turbo (OpenRouter)",
+        "- Cache: Upstash Redis (SSL)",
+        "- Cost: Optimized via OpenRouter",
+    )
     
     return True
 
@@ -7,36 +7,42 @@ import asyncio
 import os
 from dotenv import load_dotenv
 import redis.asyncio as redis
+from urllib.parse import urlparse
+from _output import emit
 
 # Load environment variables
 load_dotenv('.env.local')
 
+# Separator lines, built once
+_DASH = "-" * 60
+
+# Parsed once at import so repeated runs reuse the same connection settings
+REDIS_URL = os.getenv('REDIS_URL', '')
+_PARSED = urlparse(REDIS_URL)
+REDIS_KW = dict(
+    host=_PARSED.hostname,
+    port=_PARSED.port,
+    username=_PARSED.username,
+    password=_PARSED.password,
+    ssl=True,
+    ssl_check_hostname=False,
+    decode_responses=True,
+    socket_connect_timeout=30,
+    socket_timeout=30
+)
+
 async def test_redis_connection():
     """Test basic Redis connection"""
     
-    redis_url = os.getenv('REDIS_URL')
-    
-    print("🧪 Testing Redis Connection for ORBIT\n")
-    print(f"Redis URL: {redis_url[:30]}...")
-    print("-" * 60)
+    emit(
+        "🧪 Testing Redis Connection for ORBIT\n",
+        f"Redis URL: {REDIS_URL[:30]}...",
+        _DASH,
+    )
     
     try:
-        # Parse URL for Upstash Redis
-        from urllib.parse import urlparse
-        parsed = urlparse(redis_url)
-        
         # Create Redis client with direct connection
-        client = redis.Redis(
-            host=parsed.hostname,
-            port=parsed.port,
-            username=parsed.username,
-            password=parsed.password,
-            ssl=True,
-            ssl_check_hostname=False,
-            decode_responses=True,
-            socket_connect_timeout=30,
-            socket_timeout=30
-        )
+        client = redis.Redis(**REDIS_KW)
         
         # Test connection
         await client.ping()
@@ -4,21 +4,68 @@ Simple test script to verify OpenRouter integration with ORBIT
 """
 
 import asyncio
+import functools
 import os
+import httpx
 from dotenv import load_dotenv
-from src.agents.base_agent import OpenRouterLLM
-from langchain_core.messages import HumanMessage, SystemMessage
+from _output import emit
 
 # Load environment variables
 load_dotenv('.env.local')
 
+# Separator lines, built once
+_DASH = "-" * 60
+_DASH_SHORT = "-" * 40
+
+@functools.lru_cache(maxsize=None)
+def _test_message():
+    """Same prompt for every model, built once on first use"""
+    from langchain_core.messages import HumanMessage, SystemMessage
+    
+    return (
+        SystemMessage(content="You are a helpful AI assistant for the ORBIT platform."),
+        HumanMessage(content="Explain in one sentence what behavioral science is.")
+    )
+
+async def probe_model(model, http_client):
+    """Send the shared test prompt to one model and collect the report lines"""
+    lines = [f"\n🤖 Testing {model}..."]
+    try:
+        from src.agents.base_agent import OpenRouterLLM
+        
+        llm = OpenRouterLLM(
+            model=model,
+            temperature=0.7,
+            max_tokens=100,
+            api_key=os.getenv('OPEN_ROUTER_API_KEY'),
+            http_client=http_client
+        )
+        
+        response = await llm.ainvoke(_test_message())
+        
+        lines.append(f"✅ SUCCESS: {model}")
+        lines.append(f"Response: {response.content[:100]}...")
+        
+        if hasattr(response, 'response_metadata'):
+            usage = response.response_metadata.get('usage', {})
+            lines.append(f"Tokens: {usage.get('total_tokens', 'N/A')}")
+        
+    except Exception as e:
+        lines.append(f"❌ FAILED: {model}")
+        lines.append(f"Error: {str(e)}")
+    
+    lines.append(_DASH_SHORT)
+    return lines
+
 async def test_openrouter_basic():
     """Test basic OpenRouter functionality"""
     
-    print("🧪 Testing OpenRouter Integration for ORBIT\n")
-    print(f"OpenRouter API Key: {os.getenv('OPEN_ROUTER_API_KEY')[:20]}...")
-    print(f"Google API Key: {os.getenv('GOOGLE_API_KEY')[:20]}...")
-    print("-" * 60)
+    emit(
+        "🧪 Testing OpenRouter Integration for ORBIT\n",
+        f"OpenRouter API Key: {os.getenv('OPEN_ROUTER_API_KEY')[:20]}...",
+        f"Google API Key: {os.getenv('GOOGLE_API_KEY')[:20]}...",
+        _DASH,
+    )
     
     # Test models available through your OpenRouter key
     test_models = [
@@ -27,36 +74,16 @@ async def test_openrouter_basic():
         "meta-llama/llama-3-8b-instruct",  # Free fallback model
     ]
     
-    test_message = [
-        SystemMessage(content="You are a helpful AI assistant for the ORBIT platform."),
-        HumanMessage(content="Explain in one sentence what behavioral science is.")
-    ]
+    # One keep-alive client shared by every model probe, all probes in flight at once
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=8)
+    ) as http_client:
+        results = await asyncio.gather(*[probe_model(model, http_client) for model in test_models])
     
-    for model in test_models:
-        try:
-            print(f"\n🤖 Testing {model}...")
-            
-            llm = OpenRouterLLM(
-                model=model,
-                temperature=0.7,
-                max_tokens=100,
-                api_key=os.getenv('OPEN_ROUTER_API_KEY')
-            )
-            
-            response = await llm.ainvoke(test_message)
-            
-            print(f"✅ SUCCESS: {model}")
-            print(f"Response: {response.content[:100]}...")
-            
-            if hasattr(response, 'response_metadata'):
-                usage = response.response_metadata.get('usage', {})
-                print(f"Tokens: {usage.get('total_tokens', 'N/A')}")
-            
-        except Exception as e:
-            print(f"❌ FAILED: {model}")
-            print(f"Error: {str(e)}")
-        
-        print("-" * 40)
+    for lines in results:
+        emit(*lines)
 
 async def test_google_gemini():
     """Test Google Gemini directly"""
@@ -64,6 +91,7 @@ async def test_google_gemini():
         print("\n🌟 Testing Google Gemini Direct API...")
         
         from langchain_google_genai import ChatGoogleGenerativeAI
+        from langchain_core.messages import HumanMessage, SystemMessage
         
         llm = ChatGoogleGenerativeAI(
             model="gemini-2.5-flash",
@@ -79,24 +107,30 @@ async def test_google_gemini():
         
         response = await llm.ainvoke(test_message)
         
-        print(f"✅ SUCCESS: Google Gemini 1.5 Pro")
-        print(f"Response: {response.content[:100]}...")
+        emit(
+            f"✅ SUCCESS: Google Gemini 1.5 Pro",
+            f"Response: {response.content[:100]}...",
+        )
         
     except Exception as e:
-        print(f"❌ FAILED: Google Gemini")
-        print(f"Error: {str(e)}")
+        emit(
+            f"❌ FAILED: Google Gemini",
+            f"Error: {str(e)}",
+        )
 
 async def main():
     """Main test function"""
     await test_openrouter_basic()
     await test_google_gemini()
     
-    print("\n🎉 OpenRouter Integration Test Complete!")
-    print("\nModel Configuration for ORBIT:")
-    print("- Worker Agent: Google Gemini 2.5 Flash (direct API)")
-    print("- Supervisor Agent: Claude 3 Haiku (via OpenRouter)")
-    print("- Optimizer Agent: GPT-3.5 Turbo (via OpenRouter)")
-    print("- Fallback: Llama 3 8B (via OpenRouter)")
+    emit(
+        "\n🎉 OpenRouter Integration Test Complete!",
+        "\nModel Configuration for ORBIT:",
+        "- Worker Agent: Google Gemini 2.5 Flash (direct API)",
+        "- Supervisor Agent: Claude 3 Haiku (via OpenRouter)",
+        "- Optimizer Agent: GPT-3.5 Turbo (via OpenRouter)",
+        "- Fallback: Llama 3 8B (via OpenRouter)",
+    )
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file